@@ -7,6 +7,11 @@ City So Dangerous - 위험 상황 이미지 분석 패키지
 - analyze_image: 이미지 분석 메인 함수
 - EngineOutput, HazardType, DegreeOfRisk: 타입 정의
 - engine_output_validator: 스키마 검증기
+- engine_output_to_json / engine_output_to_bytes 등: EngineOutput 직렬화 코덱
+- ResultStore: 분석 결과 SQLite 저장소 (선택적 결과 싱크)
+- cascade_stats: 모델 cascade 단계별 hit rate / 지연시간 통계
+- llm_circuit_breaker: LLM 호출 circuit breaker (상태 조회 / 설정)
+- AnalysisScheduler, Priority: 우선순위 lane 기반 분석 스케줄러
 """
 
 # 공개 API만 export
@@ -17,7 +22,25 @@ from .engine_io import (
     DegreeOfRisk,
     HazardInfo,
     SchemaValidator,
-    engine_output_validator
+    engine_output_validator,
+    engine_output_to_json,
+    engine_output_from_json,
+    engine_output_to_bytes,
+    engine_output_from_bytes,
+    engine_outputs_to_bytes,
+    engine_outputs_from_bytes
+)
+from .result_store import ResultStore, ResultSink, HazardRecord
+from .image_metadata import ImageMetadata, extract_image_metadata
+from .cascade import CascadeStats, cascade_stats
+from .scheduler import AnalysisScheduler, Priority
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    CircuitOpenError,
+    llm_circuit_breaker,
+    is_analysis_unavailable,
+    is_degraded
 )
 
 # __all__을 사용하여 명시적으로 공개할 항목들을 정의
@@ -33,7 +56,36 @@ __all__ = [
     
     # 유틸리티
     'SchemaValidator',
-    'engine_output_validator'
+    'engine_output_validator',
+    
+    # 직렬화
+    'engine_output_to_json',
+    'engine_output_from_json',
+    'engine_output_to_bytes',
+    'engine_output_from_bytes',
+    'engine_outputs_to_bytes',
+    'engine_outputs_from_bytes',
+    
+    # 스케줄링
+    'AnalysisScheduler',
+    'Priority',
+    
+    # 결과 저장소
+    'ResultStore',
+    'ResultSink',
+    'HazardRecord',
+    'ImageMetadata',
+    'extract_image_metadata',
+    
+    # 모니터링
+    'CascadeStats',
+    'cascade_stats',
+    'CircuitBreaker',
+    'CircuitState',
+    'CircuitOpenError',
+    'llm_circuit_breaker',
+    'is_analysis_unavailable',
+    'is_degraded'
 ]
 
 # 패키지 메타데이터 - pyproject.toml에서 자동으로 읽어옴
@@ -52,6 +104,9 @@ except ImportError:
     __author__ = "City So Dangerous Team"
     __description__ = "위험 상황 이미지 분석 패키지"
 
+# numpy가 필요한 집계 모듈은 선택 의존성이므로 export하지 않음
+# - city_so_dangerous.aggregation.HazardAggregator (pip install city-so-dangerous[aggregation])
+
 # 내부 모듈들은 의도적으로 export하지 않음
 # - langgraph: 내부 구현 세부사항
 # - analyzer의 내부 함수들: _validate_result, _get_dummy_graph_result 등
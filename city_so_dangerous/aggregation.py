@@ -0,0 +1,420 @@
+"""
+도시 단위 위험 요소 집계 (EXIF 위치 x 시간)
+
+분석 결과를 위험 요소 단위의 columnar NumPy 배열로 쌓아 두고,
+격자 heatmap / 지역별 최대 위험도 / 시간대별 추이를 벡터 연산으로 계산합니다.
+numpy가 필요합니다: pip install city-so-dangerous[aggregation]
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
+
+import numpy as np
+
+from .engine_io import (
+    EngineOutput,
+    HazardType,
+    DegreeOfRisk,
+    HAZARD_TYPE_CODES,
+    DEGREE_OF_RISK_CODES,
+    safe_enum_lookup,
+)
+from .image_metadata import ImageMetadata
+
+_NO_RISK = -1
+# heatmap()이 한 번에 할당하는 격자 셀 수 상한 (0.01도 격자 기준 약 20도 x 20도)
+DEFAULT_MAX_HEATMAP_CELLS = 4_000_000
+# trend()가 한 번에 할당하는 시간 구간 수 상한 (1시간 구간 기준 약 114년)
+DEFAULT_MAX_TREND_BUCKETS = 1_000_000
+
+
+class GridHeatmap(TypedDict):
+    counts: np.ndarray  # (lat 셀, lon 셀) 위험 요소 개수
+    max_risk: np.ndarray  # (lat 셀, lon 셀) 최대 위험도 코드, 비어 있으면 -1
+    lat_origin: float  # counts[0, 0] 셀의 남서쪽 모서리
+    lon_origin: float
+    cell_size_deg: float
+
+
+class SparseHeatmap(TypedDict):
+    cell_lat: np.ndarray  # 셀 번호 (셀 남서쪽 모서리 위도 = cell_lat * cell_size_deg)
+    cell_lon: np.ndarray
+    counts: np.ndarray  # 셀별 위험 요소 개수
+    max_risk: np.ndarray  # 셀별 최대 위험도 코드
+    cell_size_deg: float
+
+
+class HazardTrend(TypedDict):
+    bucket_start: np.ndarray  # 각 시간 구간 시작 시각 (epoch seconds)
+    counts: np.ndarray  # (HazardType, 시간 구간) 위험 요소 개수
+
+
+class HazardAggregator:
+    """
+    위험 요소 단위 columnar 저장소
+
+    컬럼: hazard_type 코드(uint8), 위험도 코드(uint8), 위도/경도(float32, GPS 없으면 NaN),
+    시각(int64 epoch seconds, EXIF 촬영 시각 우선). analyze_image의 result_sink로 바로 쓸 수 있고,
+    대량 데이터는 extend()로 배열을 직접 추가합니다.
+    """
+
+    _DTYPES = {
+        "hazard_type": np.uint8,
+        "degree_of_risk": np.uint8,
+        "latitude": np.float32,
+        "longitude": np.float32,
+        "timestamp": np.int64,
+    }
+
+    def __init__(self, cell_size_deg: float = 0.01, time_bucket_seconds: int = 3600, chunk_size: int = 65536):
+        self.cell_size_deg = cell_size_deg
+        self.time_bucket_seconds = time_bucket_seconds
+        self.chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Any]] = {name: [] for name in self._DTYPES}
+        self._chunks: Dict[str, List[np.ndarray]] = {name: [] for name in self._DTYPES}
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(chunk) for chunk in self._chunks["hazard_type"]) + len(self._pending["hazard_type"])
+
+    def record(
+        self,
+        output: EngineOutput,
+        image_hash: Optional[str] = None,
+        source_id: Optional[str] = None,
+        model: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        metadata: Optional[ImageMetadata] = None,
+    ) -> None:
+        """분석 결과 한 건 추가 (ResultSink 인터페이스)"""
+        metadata = metadata or {}
+        ts = metadata.get("taken_at")
+        if ts is None:
+            ts = time.time() if timestamp is None else timestamp
+        lat = metadata.get("latitude")
+        lon = metadata.get("longitude")
+
+        with self._lock:
+            for hazard_type, info in (output.get("hazards") or {}).items():
+                hazard_type = safe_enum_lookup(HazardType, hazard_type, HazardType.OTHER)
+                risk = safe_enum_lookup(DegreeOfRisk, info.get("degree_of_risk"), DegreeOfRisk.LOW)
+                self._pending["hazard_type"].append(HAZARD_TYPE_CODES[hazard_type])
+                self._pending["degree_of_risk"].append(DEGREE_OF_RISK_CODES[risk])
+                self._pending["latitude"].append(np.nan if lat is None else lat)
+                self._pending["longitude"].append(np.nan if lon is None else lon)
+                self._pending["timestamp"].append(int(ts))
+
+            if len(self._pending["hazard_type"]) >= self.chunk_size:
+                self._flush_pending_locked()
+
+    def extend(
+        self,
+        hazard_type: np.ndarray,
+        degree_of_risk: np.ndarray,
+        latitude: np.ndarray,
+        longitude: np.ndarray,
+        timestamp: np.ndarray,
+    ) -> None:
+        """코드 배열로 여러 위험 요소를 한 번에 추가 (HAZARD_TYPE_CODES / DEGREE_OF_RISK_CODES 기준)"""
+        arrays = {
+            "hazard_type": hazard_type,
+            "degree_of_risk": degree_of_risk,
+            "latitude": latitude,
+            "longitude": longitude,
+            "timestamp": timestamp,
+        }
+        lengths = {len(values) for values in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"컬럼 길이가 서로 다릅니다: {sorted(lengths)}")
+
+        with self._lock:
+            self._flush_pending_locked()
+            for name, values in arrays.items():
+                self._chunks[name].append(np.asarray(values, dtype=self._DTYPES[name]))
+            self._columns = None
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """모든 데이터를 컬럼별 연속 배열로 반환 (다음 추가 전까지 캐시)"""
+        with self._lock:
+            self._flush_pending_locked()
+            if self._columns is None:
+                self._columns = {
+                    name: np.concatenate(chunks) if chunks else np.empty(0, dtype=self._DTYPES[name])
+                    for name, chunks in self._chunks.items()
+                }
+                # 이후 추가는 합쳐진 배열 뒤에 이어 붙임
+                self._chunks = {name: [values] for name, values in self._columns.items()}
+            return self._columns
+
+    def heatmap(
+        self,
+        hazard_type: Union[HazardType, str, None] = None,
+        min_risk: Union[DegreeOfRisk, str, None] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+        max_cells: int = DEFAULT_MAX_HEATMAP_CELLS,
+    ) -> GridHeatmap:
+        """
+        GPS가 있는 위험 요소를 cell_size_deg 격자로 집계한 개수 / 최대 위험도
+
+        bounds: (min_lat, min_lon, max_lat, max_lon) 지정 시 해당 영역의 격자만 생성
+        격자가 max_cells를 넘으면 할당하지 않고 ValueError (잘못 태깅된 좌표 하나로도 범위가
+        도시 밖으로 커질 수 있으므로 bounds를 주거나 heatmap_cells()를 사용)
+        """
+        columns = self.columns()
+        mask = self._mask(columns, hazard_type, min_risk, since, until)
+        mask &= self._bounds_mask(columns, bounds)
+
+        lat_cell, lon_cell = self._cells(columns, mask)
+        risk = columns["degree_of_risk"][mask]
+
+        if bounds is not None:
+            min_lat, min_lon, max_lat, max_lon = bounds
+            lat_min = int(np.floor(min_lat / self.cell_size_deg))
+            lon_min = int(np.floor(min_lon / self.cell_size_deg))
+            lat_max = int(np.ceil(max_lat / self.cell_size_deg)) - 1
+            lon_max = int(np.ceil(max_lon / self.cell_size_deg)) - 1
+            # 경계에 걸친 값은 나눗셈 반올림으로 격자 밖 셀이 될 수 있으므로 셀 번호로 한 번 더 거름
+            inside = (lat_cell >= lat_min) & (lat_cell <= lat_max) & (lon_cell >= lon_min) & (lon_cell <= lon_max)
+            lat_cell, lon_cell, risk = lat_cell[inside], lon_cell[inside], risk[inside]
+        elif lat_cell.size:
+            lat_min, lon_min = int(lat_cell.min()), int(lon_cell.min())
+            lat_max, lon_max = int(lat_cell.max()), int(lon_cell.max())
+        else:
+            return {
+                "counts": np.zeros((0, 0), dtype=np.int64),
+                "max_risk": np.zeros((0, 0), dtype=np.int8),
+                "lat_origin": 0.0,
+                "lon_origin": 0.0,
+                "cell_size_deg": self.cell_size_deg,
+            }
+
+        shape = (max(0, lat_max - lat_min + 1), max(0, lon_max - lon_min + 1))
+        if shape[0] * shape[1] > max_cells:
+            raise ValueError(
+                f"heatmap 격자가 너무 큽니다: {shape[0]} x {shape[1]} 셀 (max_cells={max_cells}). "
+                "bounds를 지정하거나 heatmap_cells()를 사용하세요"
+            )
+
+        flat = (lat_cell - lat_min) * shape[1] + (lon_cell - lon_min)
+        counts, max_risk = _count_and_max_risk(flat, risk, shape[0] * shape[1])
+        return {
+            "counts": counts.reshape(shape),
+            "max_risk": max_risk.reshape(shape),
+            "lat_origin": float(lat_min * self.cell_size_deg),
+            "lon_origin": float(lon_min * self.cell_size_deg),
+            "cell_size_deg": self.cell_size_deg,
+        }
+
+    def heatmap_cells(
+        self,
+        hazard_type: Union[HazardType, str, None] = None,
+        min_risk: Union[DegreeOfRisk, str, None] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+    ) -> SparseHeatmap:
+        """heatmap의 희소 버전: 위험 요소가 있는 셀만 반환하므로 좌표 범위와 무관하게 메모리가 일정"""
+        columns = self.columns()
+        mask = self._mask(columns, hazard_type, min_risk, since, until)
+        mask &= self._bounds_mask(columns, bounds)
+
+        lat_cell, lon_cell = self._cells(columns, mask)
+        risk = columns["degree_of_risk"][mask]
+
+        if lat_cell.size == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return {
+                "cell_lat": empty,
+                "cell_lon": empty,
+                "counts": empty,
+                "max_risk": np.empty(0, dtype=np.int8),
+                "cell_size_deg": self.cell_size_deg,
+            }
+
+        # 위경도 범위는 유한하므로 (lat, lon) 셀 번호를 int64 하나로 묶을 수 있음
+        lat_min, lon_min = int(lat_cell.min()), int(lon_cell.min())
+        lon_size = int(lon_cell.max()) - lon_min + 1
+        groups, inverse = np.unique((lat_cell - lat_min) * lon_size + (lon_cell - lon_min), return_inverse=True)
+        counts, max_risk = _count_and_max_risk(inverse.ravel(), risk, groups.size)
+        lat_offset, lon_offset = np.divmod(groups, lon_size)
+        return {
+            "cell_lat": lat_offset + lat_min,
+            "cell_lon": lon_offset + lon_min,
+            "counts": counts,
+            "max_risk": max_risk,
+            "cell_size_deg": self.cell_size_deg,
+        }
+
+    def trend(
+        self,
+        min_risk: Union[DegreeOfRisk, str, None] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+        max_buckets: int = DEFAULT_MAX_TREND_BUCKETS,
+    ) -> HazardTrend:
+        """
+        HazardType별 time_bucket_seconds 구간 개수
+
+        bounds: (min_lat, min_lon, max_lat, max_lon) 지정 시 해당 영역만 집계
+        시간 구간이 max_buckets를 넘으면 할당하지 않고 ValueError (시계가 초기화된 카메라의
+        촬영 시각 하나로도 범위가 수십 년으로 커질 수 있으므로 since / until을 지정)
+        """
+        columns = self.columns()
+        mask = self._mask(columns, None, min_risk, since, until)
+        if bounds is not None:
+            mask &= self._bounds_mask(columns, bounds)
+
+        bucket = columns["timestamp"][mask] // self.time_bucket_seconds
+        hazard = columns["hazard_type"][mask].astype(np.int64)
+        n_types = len(HAZARD_TYPE_CODES)
+
+        if bucket.size == 0:
+            return {"bucket_start": np.empty(0, dtype=np.int64), "counts": np.zeros((n_types, 0), dtype=np.int64)}
+
+        first = bucket.min()
+        n_buckets = int(bucket.max() - first + 1)
+        if n_buckets > max_buckets:
+            raise ValueError(
+                f"trend 시간 구간이 너무 많습니다: {n_buckets}개 (max_buckets={max_buckets}). "
+                "since / until을 지정하거나 time_bucket_seconds를 늘리세요"
+            )
+        counts = np.bincount(hazard * n_buckets + (bucket - first), minlength=n_types * n_buckets)
+        return {
+            "bucket_start": (first + np.arange(n_buckets, dtype=np.int64)) * self.time_bucket_seconds,
+            "counts": counts.reshape(n_types, n_buckets),
+        }
+
+    def export_npz(
+        self,
+        path: str,
+        min_risk: Union[DegreeOfRisk, str, None] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        bounds: Optional[Tuple[float, float, float, float]] = None,
+        compress: bool = False,
+    ) -> int:
+        """
+        (격자 셀, 시간 구간, HazardType)별 개수와 최대 위험도를 희소 형태로 저장
+
+        셀/시간 구간은 최소값(*_origin) 기준 offset으로, 값 범위에 맞는 가장 작은 정수형으로 저장합니다.
+        compress=True면 zlib 압축까지 적용합니다 (파일은 더 작지만 저장이 느림).
+        반환값은 저장된 그룹 행 수입니다.
+        """
+        columns = self.columns()
+        mask = self._mask(columns, None, min_risk, since, until)
+        mask &= self._bounds_mask(columns, bounds)
+
+        lat_cell, lon_cell = self._cells(columns, mask)
+        bucket = columns["timestamp"][mask] // self.time_bucket_seconds
+        hazard = columns["hazard_type"][mask]
+        risk = columns["degree_of_risk"][mask]
+
+        # (lat, lon, 시간, 종류)를 하나의 int64 키로 묶어 unique -> 그룹 번호(inverse)로 벡터 집계
+        parts = [lat_cell, lon_cell, bucket, hazard.astype(np.int64)]
+        origins = [int(part.min()) if part.size else 0 for part in parts]
+        sizes = [int(part.max()) - origin + 1 if part.size else 1 for part, origin in zip(parts, origins)]
+        if np.prod([float(size) for size in sizes]) >= 2 ** 63:
+            raise ValueError("집계 범위가 너무 넓습니다. cell_size_deg 또는 time_bucket_seconds를 늘리세요")
+
+        key = np.zeros(lat_cell.size, dtype=np.int64)
+        for part, origin, size in zip(parts, origins, sizes):
+            key = key * size + (part - origin)
+        groups, inverse = np.unique(key, return_inverse=True)
+        counts, max_risk = _count_and_max_risk(inverse.ravel(), risk, groups.size)
+
+        offsets = []
+        for size in reversed(sizes):
+            groups, part = np.divmod(groups, size)
+            offsets.append(part.astype(np.min_scalar_type(size - 1)))
+        hazard_offset, bucket_offset, lon_offset, lat_offset = offsets
+
+        save = np.savez_compressed if compress else np.savez
+        save(
+            path,
+            lat_cell_offset=lat_offset,
+            lon_cell_offset=lon_offset,
+            bucket_offset=bucket_offset,
+            hazard_type=(hazard_offset + origins[3]).astype(np.uint8),
+            count=counts.astype(np.min_scalar_type(int(counts.max()) if counts.size else 0)),
+            max_risk=max_risk,
+            lat_cell_origin=np.int64(origins[0]),
+            lon_cell_origin=np.int64(origins[1]),
+            bucket_origin=np.int64(origins[2]),
+            cell_size_deg=np.float64(self.cell_size_deg),
+            time_bucket_seconds=np.int64(self.time_bucket_seconds),
+        )
+        return int(counts.size)
+
+    def _flush_pending_locked(self) -> None:
+        if not self._pending["hazard_type"]:
+            return
+        for name, values in self._pending.items():
+            self._chunks[name].append(np.asarray(values, dtype=self._DTYPES[name]))
+            self._pending[name] = []
+        self._columns = None
+
+    def _cells(self, columns: Dict[str, np.ndarray], mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """mask된 위험 요소의 (lat, lon) 격자 셀 번호"""
+        lat = columns["latitude"][mask].astype(np.float64)
+        lon = columns["longitude"][mask].astype(np.float64)
+        return (
+            np.floor(lat / self.cell_size_deg).astype(np.int64),
+            np.floor(lon / self.cell_size_deg).astype(np.int64),
+        )
+
+    @staticmethod
+    def _bounds_mask(
+        columns: Dict[str, np.ndarray],
+        bounds: Optional[Tuple[float, float, float, float]],
+    ) -> np.ndarray:
+        """GPS가 있고 bounds (min_lat, min_lon, max_lat, max_lon) 안에 있는 위험 요소"""
+        lat, lon = columns["latitude"], columns["longitude"]
+        if bounds is None:
+            return ~np.isnan(lat) & ~np.isnan(lon)
+        min_lat, min_lon, max_lat, max_lon = bounds
+        # _cells()와 같은 float64 값으로 비교 (float32 비교면 경계 바로 아래 값이 통과함)
+        lat, lon = lat.astype(np.float64), lon.astype(np.float64)
+        # NaN 비교는 항상 False이므로 GPS 없는 값도 함께 제외됨
+        return (lat >= min_lat) & (lat < max_lat) & (lon >= min_lon) & (lon < max_lon)
+
+    @staticmethod
+    def _mask(
+        columns: Dict[str, np.ndarray],
+        hazard_type: Union[HazardType, str, None],
+        min_risk: Union[DegreeOfRisk, str, None],
+        since: Optional[float],
+        until: Optional[float],
+    ) -> np.ndarray:
+        mask = np.ones(columns["hazard_type"].size, dtype=bool)
+        if hazard_type is not None:
+            hazard_type = safe_enum_lookup(HazardType, hazard_type)
+            if hazard_type is None:
+                raise ValueError("알 수 없는 hazard_type입니다")
+            mask &= columns["hazard_type"] == HAZARD_TYPE_CODES[hazard_type]
+        if min_risk is not None:
+            min_risk = safe_enum_lookup(DegreeOfRisk, min_risk)
+            if min_risk is None:
+                raise ValueError("알 수 없는 min_risk입니다")
+            mask &= columns["degree_of_risk"] >= DEGREE_OF_RISK_CODES[min_risk]
+        if since is not None:
+            mask &= columns["timestamp"] >= since
+        if until is not None:
+            mask &= columns["timestamp"] < until
+        return mask
+
+
+def _count_and_max_risk(group: np.ndarray, risk: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """그룹 번호별 개수와 최대 위험도 코드 (위험도 단계 수만큼 bincount, 빈 그룹은 -1)"""
+    counts = np.bincount(group, minlength=n_groups)
+    max_risk = np.full(n_groups, _NO_RISK, dtype=np.int8)
+    for code in sorted(DEGREE_OF_RISK_CODES.values()):
+        present = np.bincount(group[risk >= code], minlength=n_groups) > 0
+        max_risk[present] = code
+    return counts, max_risk
@@ -1,13 +1,100 @@
 
 import base64
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
 from io import BytesIO
 from PIL import Image
-from typing import Dict, Any
+from typing import Dict, Any, List, Literal, Optional, Sequence, Tuple, Union
 from .engine_io import EngineOutput, HazardType, DegreeOfRisk, engine_output_validator
 from .graph import analyzing_graph
+from .image_metadata import ImageMetadata, extract_image_metadata
+from .result_store import ResultSink
+from .circuit_breaker import (
+    CircuitOpenError,
+    llm_circuit_breaker,
+    analysis_unavailable_output,
+    degraded_output
+)
 
+logger = logging.getLogger(__name__)
 
-def analyze_image(image_bytes: bytes) -> EngineOutput:
+# 회로가 열렸을 때 degraded 응답으로 쓰는 source별 (저장 시각, 마지막 정상 결과)
+_LAST_RESULTS_MAX = 10000
+_last_results: "OrderedDict[str, Tuple[float, EngineOutput]]" = OrderedDict()
+# AnalysisScheduler 등 여러 워커 스레드에서 호출되므로 갱신은 lock으로 보호
+_last_results_lock = threading.Lock()
+
+
+def analyze_image(
+    image_bytes: bytes,
+    source_id: Optional[str] = None,
+    result_sink: Union[ResultSink, Sequence[ResultSink], None] = None,
+    degraded_response: Literal["last_result", "unavailable"] = "last_result",
+) -> EngineOutput:
+    """
+    이미지를 분석하여 EngineOutput 반환
+
+    result_sink(하나 또는 여러 개)가 주어지면 이미지 해시, source_id, 모델, 지연시간,
+    EXIF GPS/촬영 시각과 함께 결과를 기록합니다. sink 기록이 실패해도 로그만 남기고
+    나머지 sink 기록과 결과 반환은 그대로 진행합니다.
+    LLM circuit breaker가 열려 있으면 graph를 실행하지 않고 degraded 응답을 즉시 반환합니다.
+    - "last_result": 해당 source의 마지막 정상 결과의 복사본에 "degraded": True와
+      "cached_at"(결과 시각)을 붙인 응답 (없으면 "unavailable")
+    - "unavailable": error.code가 "analysis_unavailable"인 응답
+    """
+    if llm_circuit_breaker.is_rejecting():
+        return _degraded_result(source_id, result_sink, degraded_response)
+
+    started = time.perf_counter()
+    try:
+        result, model, metadata = _run_analysis(image_bytes)
+    except CircuitOpenError:
+        # graph 실행 중에 회로가 열린 경우
+        return _degraded_result(source_id, result_sink, degraded_response)
+
+    if source_id is not None and "hazards" in result:
+        with _last_results_lock:
+            _last_results[source_id] = (time.time(), result)
+            _last_results.move_to_end(source_id)
+            if len(_last_results) > _LAST_RESULTS_MAX:
+                _last_results.popitem(last=False)
+
+    sinks = _as_sinks(result_sink)
+    if sinks:
+        image_hash = hashlib.sha256(image_bytes).hexdigest()
+        latency_ms = (time.perf_counter() - started) * 1000
+        timestamp = time.time()
+        for sink in sinks:
+            try:
+                sink.record(
+                    result,
+                    image_hash=image_hash,
+                    source_id=source_id,
+                    model=model,
+                    latency_ms=latency_ms,
+                    timestamp=timestamp,
+                    metadata=metadata,
+                )
+            except Exception:
+                # 저장 실패(DB lock, 디스크 부족 등)로 이미 끝난 분석 결과를 버리지 않음
+                logger.exception("result_sink 기록 실패: %r", sink)
+
+    return result
+
+
+def _as_sinks(result_sink: Union[ResultSink, Sequence[ResultSink], None]) -> List[ResultSink]:
+    if result_sink is None:
+        return []
+    if isinstance(result_sink, (list, tuple)):
+        return list(result_sink)
+    return [result_sink]
+
+
+def _run_analysis(image_bytes: bytes) -> Tuple[EngineOutput, Optional[str], Optional[ImageMetadata]]:
+    """graph를 실행하여 (결과, 사용된 모델명, EXIF 메타데이터) 반환"""
     try:
         # 1. 이미지 로드
         image = Image.open(BytesIO(image_bytes))
@@ -18,6 +105,9 @@ def analyze_image(image_bytes: bytes) -> EngineOutput:
         # 이미지를 다시 열어서 사용 (verify() 후에는 이미지가 닫힘)
         image = Image.open(BytesIO(image_bytes))
         
+        # EXIF에서 GPS 좌표와 촬영 시각 추출 (집계용)
+        metadata = extract_image_metadata(image)
+        
         # 이미지를 base64로 인코딩 (graph에 전달하기 위해)
         image_base64 = base64.b64encode(image_bytes).decode('utf-8')
 
@@ -29,7 +119,10 @@ def analyze_image(image_bytes: bytes) -> EngineOutput:
             "validated_result": None,
             "needs_retry": False,
             "retry_count": 0,
-            "error": None
+            "error": None,
+            "model_used": None,
+            "cascade_tier": 0,
+            "tier_started_at": None
         }
         
         final_state = analyzing_graph.invoke(initial_state)
@@ -39,15 +132,41 @@ def analyze_image(image_bytes: bytes) -> EngineOutput:
         validated_result = _validate_result(graph_result)
 
         # 4. 결과값 정상일 시 반환
-        return validated_result
+        return validated_result, final_state.get("model_used"), metadata
         
+    except CircuitOpenError:
+        raise
     except Exception as e:
         # 에러 발생 시 기본값 반환
         return {
             "error": {
                     "description": f"이미지 분석 중 오류가 발생했습니다: {str(e)}"
             }
-        }
+        }, None, None
+
+
+def _degraded_result(
+    source_id: Optional[str],
+    result_sink: Union[ResultSink, Sequence[ResultSink], None],
+    degraded_response: str,
+) -> EngineOutput:
+    """회로가 열려 있을 때 graph 대신 반환할 응답"""
+    if degraded_response == "last_result" and source_id is not None:
+        with _last_results_lock:
+            cached = _last_results.get(source_id)
+        for sink in _as_sinks(result_sink):
+            if cached is not None:
+                break
+            if hasattr(sink, "latest_for_source"):
+                output = sink.latest_for_source(source_id)
+                if output is not None:
+                    records = sink.query_hazards(source_id=source_id, limit=1)
+                    cached = (records[0]["timestamp"] if records else None, output)
+        if cached is not None:
+            cached_at, output = cached
+            return degraded_output(output, cached_at)
+
+    return analysis_unavailable_output(llm_circuit_breaker.retry_after())
 
 
 def _get_dummy_graph_result() -> Dict[str, Any]:
@@ -0,0 +1,81 @@
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from .model import AnalysisResult, DegreeOfRisk
+
+# 이 위험도가 하나라도 있으면 빠른 모델 결과를 그대로 쓰지 않고 상위 모델로 확인
+ESCALATION_RISKS = frozenset({DegreeOfRisk.HIGH, DegreeOfRisk.CRITICAL})
+
+
+def needs_escalation(result: Optional[AnalysisResult], confidence_threshold: float) -> bool:
+    """결과를 현재 단계에서 확정할 수 없으면 True (신뢰도 부족 또는 HIGH/CRITICAL 위험)"""
+    if result is None or result.confidence_score is None:
+        return True
+
+    if result.confidence_score < confidence_threshold:
+        return True
+
+    return any(info.degree_of_risk in ESCALATION_RISKS for info in result.hazards.values())
+
+
+class CascadeStats:
+    """모델 cascade 단계별 처리 건수와 지연시간 기록 (threshold 튜닝용)"""
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._tiers: Dict[str, Dict[str, Any]] = {}
+
+    def _tier(self, model: str) -> Dict[str, Any]:
+        if model not in self._tiers:
+            self._tiers[model] = {
+                "accepted": 0,
+                "escalated": 0,
+                "failed": 0,
+                "latencies_ms": deque(maxlen=self.max_samples),
+            }
+        return self._tiers[model]
+
+    def record(self, model: str, outcome: str, latency_ms: float) -> None:
+        """outcome: "accepted" | "escalated" | "failed" """
+        with self._lock:
+            tier = self._tier(model)
+            tier[outcome] += 1
+            tier["latencies_ms"].append(latency_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """단계(모델)별 요청 수, hit rate, 지연시간 p50/p95 반환"""
+        with self._lock:
+            tiers = {
+                model: (tier["accepted"], tier["escalated"], tier["failed"], sorted(tier["latencies_ms"]))
+                for model, tier in self._tiers.items()
+            }
+
+        result = {}
+        for model, (accepted, escalated, failed, latencies) in tiers.items():
+            total = accepted + escalated + failed
+            result[model] = {
+                "requests": total,
+                "accepted": accepted,
+                "escalated": escalated,
+                "failed": failed,
+                "hit_rate": accepted / total if total else 0.0,
+                "latency_p50_ms": _percentile(latencies, 0.5),
+                "latency_p95_ms": _percentile(latencies, 0.95),
+            }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tiers.clear()
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+# graph 노드들이 공유하는 글로벌 통계
+cascade_stats = CascadeStats()
@@ -0,0 +1,218 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CircuitState(Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않고 즉시 거부됨"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM circuit is open (retry after {retry_after:.1f}s)")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    LLM 백엔드 호출용 circuit breaker
+
+    최근 window_size개 호출 중 실패율 또는 느린 호출 비율이 임계값을 넘으면 OPEN으로 전환하여
+    open_duration 동안 호출을 즉시 거부합니다. 이후 HALF_OPEN에서 half_open_max_calls개의
+    probe 호출이 모두 성공하면 CLOSED로, 하나라도 실패하면 다시 OPEN으로 돌아갑니다.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold_ms: float = 30000.0,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold_ms = slow_call_threshold_ms
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (실패 여부, 느린 호출 여부)
+        self._window: deque = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def is_rejecting(self) -> bool:
+        """지금 호출하면 거부될지 확인 (probe 슬롯은 소비하지 않고, 거부 시 rejected 집계)"""
+        with self._lock:
+            self._maybe_half_open()
+            rejecting = self._state is CircuitState.OPEN or (
+                self._state is CircuitState.HALF_OPEN
+                and self._probes_in_flight >= self.half_open_max_calls
+            )
+            if rejecting:
+                self._rejected += 1
+            return rejecting
+
+    def retry_after(self) -> float:
+        """OPEN 상태가 끝날 때까지 남은 시간(초)"""
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_duration - self._clock())
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """fn을 호출하고 결과를 기록. 회로가 열려 있으면 CircuitOpenError"""
+        self._acquire()
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._record(failed=True, latency_ms=(time.perf_counter() - started) * 1000)
+            raise
+        self._record(failed=False, latency_ms=(time.perf_counter() - started) * 1000)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """모니터링용 현재 상태"""
+        with self._lock:
+            self._maybe_half_open()
+            calls = len(self._window)
+            return {
+                "state": self._state.value,
+                "calls_in_window": calls,
+                "failure_rate": self._failure_rate(),
+                "slow_call_rate": self._slow_call_rate(),
+                "retry_after": (
+                    max(0.0, self._opened_at + self.open_duration - self._clock())
+                    if self._state is CircuitState.OPEN else 0.0
+                ),
+                "rejected": self._rejected,
+                "times_opened": self._times_opened,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._window.clear()
+            self._state = CircuitState.CLOSED
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            self._rejected = 0
+            self._times_opened = 0
+
+    def _acquire(self) -> None:
+        with self._lock:
+            self._maybe_half_open()
+            if self._state is CircuitState.OPEN:
+                self._rejected += 1
+                raise CircuitOpenError(self._opened_at + self.open_duration - self._clock())
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_max_calls:
+                    self._rejected += 1
+                    raise CircuitOpenError(0.0)
+                self._probes_in_flight += 1
+
+    def _record(self, failed: bool, latency_ms: float) -> None:
+        slow = latency_ms >= self.slow_call_threshold_ms
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if failed or slow:
+                    self._open()
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    self._state = CircuitState.CLOSED
+                    self._window.clear()
+                return
+
+            if self._state is CircuitState.OPEN:
+                # 회로가 열리기 전에 시작된 호출의 결과는 무시
+                return
+
+            self._window.append((failed, slow))
+            if len(self._window) >= self.minimum_calls and (
+                self._failure_rate() >= self.failure_rate_threshold
+                or self._slow_call_rate() >= self.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._times_opened += 1
+
+    def _maybe_half_open(self) -> None:
+        if self._state is CircuitState.OPEN and self._clock() - self._opened_at >= self.open_duration:
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+
+    def _failure_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return sum(1 for failed, _ in self._window if failed) / len(self._window)
+
+    def _slow_call_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return sum(1 for _, slow in self._window if slow) / len(self._window)
+
+
+# graph 노드들의 LLM 호출이 공유하는 breaker
+llm_circuit_breaker = CircuitBreaker()
+
+# 회로가 열려 있고 대체할 캐시 결과도 없을 때 반환되는 응답의 error.code
+ANALYSIS_UNAVAILABLE = "analysis_unavailable"
+
+
+def analysis_unavailable_output(retry_after: Optional[float] = None) -> Dict[str, Any]:
+    """analysis unavailable 표시 응답 (analyze_image의 error 응답 형식을 따름)"""
+    return {
+        "error": {
+            "code": ANALYSIS_UNAVAILABLE,
+            "description": "LLM 백엔드 장애로 현재 분석을 사용할 수 없습니다.",
+            "retry_after": retry_after,
+        }
+    }
+
+
+def degraded_output(cached: Dict[str, Any], cached_at: Optional[float]) -> Dict[str, Any]:
+    """캐시된 결과의 복사본에 degraded 표시를 붙인 응답 (호출자가 수정해도 캐시는 그대로)"""
+    output = dict(cached)
+    if "hazards" in cached:
+        output["hazards"] = {hazard_type: dict(info) for hazard_type, info in cached["hazards"].items()}
+    output["degraded"] = True
+    output["cached_at"] = cached_at
+    return output
+
+
+def is_analysis_unavailable(output: Dict[str, Any]) -> bool:
+    return output.get("error", {}).get("code") == ANALYSIS_UNAVAILABLE
+
+
+def is_degraded(output: Dict[str, Any]) -> bool:
+    """새로 분석한 결과가 아닌 응답 (캐시된 결과 또는 analysis unavailable)인지 확인"""
+    return bool(output.get("degraded")) or is_analysis_unavailable(output)
@@ -1,11 +1,13 @@
 from enum import Enum
-from typing import Dict, TypedDict, Optional, Type, Union, Any, get_type_hints, get_origin, get_args
+from typing import Dict, Iterable, List, Tuple, TypedDict, Optional, Type, Union, Any, get_type_hints, get_origin, get_args
 import inspect
+import json
 
 class DegreeOfRisk(Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
+    CRITICAL = "critical"
 
 class HazardType(Enum):
     FIRE = "fire"
@@ -31,6 +33,12 @@ class EngineOutput(TypedDict):
     hazards: Dict[HazardType, HazardInfo]
 
 
+# 컬럼/바이너리 저장용 정수 코드 (Enum 정의 순서 = 코드, 위험도는 낮을수록 작은 값)
+# 저장된 데이터와의 호환을 위해 Enum 멤버는 항상 끝에만 추가할 것
+HAZARD_TYPE_CODES: Dict[HazardType, int] = {item: code for code, item in enumerate(HazardType)}
+DEGREE_OF_RISK_CODES: Dict[DegreeOfRisk, int] = {item: code for code, item in enumerate(DegreeOfRisk)}
+
+
 # 자동 매핑을 위한 헬퍼 함수들
 def safe_enum_lookup(enum_class: Type[Enum], value: Union[str, Enum], default: Enum = None) -> Enum:
     """
@@ -191,3 +199,193 @@ class SchemaValidator:
 
 # EngineOutput용 글로벌 검증기
 engine_output_validator = SchemaValidator(EngineOutput)
+
+
+# EngineOutput 직렬화 코덱
+_HAZARD_BY_VALUE = {item.value: item for item in HazardType}
+_RISK_BY_VALUE = {item.value: item for item in DegreeOfRisk}
+_HAZARD_BY_CODE = {code: item for item, code in HAZARD_TYPE_CODES.items()}
+_RISK_BY_CODE = {code: item for item, code in DEGREE_OF_RISK_CODES.items()}
+
+# json.dumps(**kwargs)는 호출마다 encoder를 새로 만들므로 재사용
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+_BINARY_VERSION = 1
+# 위험 요소 개수 대신 이 값이 오면 JSON 레코드 (본문은 length-prefixed engine_output_to_json 결과)
+# error 응답이나 hazards 외 키(degraded, cached_at 등)가 있는 응답은 키를 잃지 않도록 이 형식으로 저장
+_BINARY_JSON_MARKER = 0xFF
+
+
+def engine_output_to_json(output: EngineOutput) -> str:
+    """EngineOutput을 JSON 문자열로 변환 (Enum은 value 문자열로)"""
+    hazards = output.get("hazards")
+    if hazards is None:
+        return _JSON_ENCODER.encode(output)
+
+    data = dict(output)
+    data["hazards"] = {
+        _enum_str(hazard_type): {
+            "degree_of_risk": _enum_str(info["degree_of_risk"]),
+            "description": info["description"],
+        }
+        for hazard_type, info in hazards.items()
+    }
+    return _JSON_ENCODER.encode(data)
+
+
+def engine_output_from_json(text: Union[str, bytes]) -> EngineOutput:
+    """engine_output_to_json 결과를 Enum 키/값을 가진 EngineOutput으로 복원"""
+    data = json.loads(text)
+    hazards = data.get("hazards")
+    if hazards is None:
+        return data
+
+    data["hazards"] = {
+        _HAZARD_BY_VALUE.get(hazard_type) or safe_enum_lookup(HazardType, hazard_type, HazardType.OTHER): {
+            "degree_of_risk": (
+                _RISK_BY_VALUE.get(info["degree_of_risk"])
+                or safe_enum_lookup(DegreeOfRisk, info["degree_of_risk"], DegreeOfRisk.LOW)
+            ),
+            "description": info["description"],
+        }
+        for hazard_type, info in hazards.items()
+    }
+    return data
+
+
+def engine_output_to_bytes(output: EngineOutput) -> bytes:
+    """
+    EngineOutput을 compact 바이너리로 인코딩
+
+    형식: 버전(1B) + 레코드
+    레코드: 위험 요소 수(1B) + [hazard_type 코드(1B), 위험도 코드(1B), 설명 길이(varint), UTF-8 설명] * N
+    hazards만 있는 응답이 아니면: 0xFF + JSON 길이(varint) + UTF-8 JSON
+    """
+    buf = bytearray((_BINARY_VERSION,))
+    _write_binary_record(buf, output)
+    return bytes(buf)
+
+
+def engine_output_from_bytes(data: bytes) -> EngineOutput:
+    """engine_output_to_bytes 결과를 복원 (잘리거나 손상된 입력이면 ValueError)"""
+    view = memoryview(data)
+    _check_binary_version(view)
+    output, pos = _read_binary_record(view, 1)
+    _check_binary_end(view, pos)
+    return output
+
+
+def engine_outputs_to_bytes(outputs: Iterable[EngineOutput]) -> bytes:
+    """여러 EngineOutput을 하나의 바이너리로 인코딩 (버전 + 레코드 수(varint) + 레코드들)"""
+    records = bytearray()
+    count = 0
+    for output in outputs:
+        _write_binary_record(records, output)
+        count += 1
+
+    buf = bytearray((_BINARY_VERSION,))
+    _write_uvarint(buf, count)
+    buf += records
+    return bytes(buf)
+
+
+def engine_outputs_from_bytes(data: bytes) -> List[EngineOutput]:
+    """engine_outputs_to_bytes 결과를 복원 (잘리거나 손상된 입력이면 ValueError)"""
+    view = memoryview(data)
+    _check_binary_version(view)
+    count, pos = _read_uvarint(view, 1)
+
+    outputs = []
+    for _ in range(count):
+        output, pos = _read_binary_record(view, pos)
+        outputs.append(output)
+    _check_binary_end(view, pos)
+    return outputs
+
+
+def _enum_str(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _write_uvarint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _read_uvarint(view: memoryview, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(view) or shift > 63:
+            raise ValueError(f"EngineOutput 바이너리의 varint가 잘렸거나 너무 깁니다 (offset {pos})")
+        byte = view[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_binary_record(buf: bytearray, output: EngineOutput) -> None:
+    hazards = output.get("hazards")
+    if hazards is None or len(output) > 1:
+        payload = engine_output_to_json(output).encode("utf-8")
+        buf.append(_BINARY_JSON_MARKER)
+        _write_uvarint(buf, len(payload))
+        buf += payload
+        return
+
+    if len(hazards) >= _BINARY_JSON_MARKER:
+        raise ValueError(f"위험 요소가 너무 많습니다: {len(hazards)}")
+
+    buf.append(len(hazards))
+    for hazard_type, info in hazards.items():
+        description = info["description"].encode("utf-8")
+        buf.append(HAZARD_TYPE_CODES[safe_enum_lookup(HazardType, hazard_type, HazardType.OTHER)])
+        buf.append(DEGREE_OF_RISK_CODES[safe_enum_lookup(DegreeOfRisk, info["degree_of_risk"], DegreeOfRisk.LOW)])
+        _write_uvarint(buf, len(description))
+        buf += description
+
+
+def _read_binary_record(view: memoryview, pos: int) -> Tuple[EngineOutput, int]:
+    end = len(view)
+    if pos >= end:
+        raise ValueError(f"EngineOutput 바이너리가 잘렸습니다 (offset {pos})")
+    count = view[pos]
+    pos += 1
+
+    if count == _BINARY_JSON_MARKER:
+        length, pos = _read_uvarint(view, pos)
+        if pos + length > end:
+            raise ValueError(f"EngineOutput 바이너리가 잘렸습니다 (offset {pos})")
+        return engine_output_from_json(bytes(view[pos:pos + length])), pos + length
+
+    hazards = {}
+    for _ in range(count):
+        if pos + 2 > end:
+            raise ValueError(f"EngineOutput 바이너리가 잘렸습니다 (offset {pos})")
+        hazard_type = _HAZARD_BY_CODE.get(view[pos])
+        risk = _RISK_BY_CODE.get(view[pos + 1])
+        if hazard_type is None or risk is None:
+            raise ValueError(f"알 수 없는 hazard_type / 위험도 코드입니다: {view[pos]}, {view[pos + 1]} (offset {pos})")
+        length, pos = _read_uvarint(view, pos + 2)
+        if pos + length > end:
+            raise ValueError(f"EngineOutput 바이너리가 잘렸습니다 (offset {pos})")
+        hazards[hazard_type] = {
+            "degree_of_risk": risk,
+            "description": bytes(view[pos:pos + length]).decode("utf-8"),
+        }
+        pos += length
+    return {"hazards": hazards}, pos
+
+
+def _check_binary_end(view: memoryview, pos: int) -> None:
+    if pos != len(view):
+        raise ValueError(f"EngineOutput 바이너리 뒤에 남는 바이트가 있습니다: {len(view) - pos}B")
+
+
+def _check_binary_version(view: memoryview) -> None:
+    if not len(view) or view[0] != _BINARY_VERSION:
+        raise ValueError(f"지원하지 않는 EngineOutput 바이너리 버전입니다: {view[0] if len(view) else None}")
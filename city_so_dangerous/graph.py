@@ -1,38 +1,48 @@
+from functools import partial
+from typing import Optional
 from langgraph.graph import StateGraph, START, END
-from .model import HazardAnalysisState
+from .model import HazardAnalysisState, GraphConfig
 from .nodes import (
     llm_analysis_node,
     validation_node, 
     refactor_node,
+    route_llm_call_node,
     route_decision_node,
+    escalate_node,
     error_handler_node,
     success_node
 )
 
 
-def create_hazard_analysis_graph():
+def create_hazard_analysis_graph(graph_config: Optional[GraphConfig] = None):
+    graph_config = graph_config or GraphConfig()
     workflow = StateGraph(HazardAnalysisState)
     
-    workflow.add_node("llm_analysis", llm_analysis_node)
+    workflow.add_node("llm_analysis", partial(llm_analysis_node, graph_config=graph_config))
     workflow.add_node("validation", validation_node)
-    workflow.add_node("refactor", refactor_node)
-    workflow.add_node("error_handler", error_handler_node)
+    workflow.add_node("refactor", partial(refactor_node, graph_config=graph_config))
+    workflow.add_node("escalate", escalate_node)
+    workflow.add_node("error_handler", partial(error_handler_node, graph_config=graph_config))
     workflow.add_node("success", success_node)
     
     workflow.add_edge(START, "llm_analysis")
-    workflow.add_edge("llm_analysis", "validation")
+    # 상위 단계 LLM 호출이 실패하면 하위 단계 결과로 대체하도록 error_handler로 보냄
+    llm_call_routes = {"validation": "validation", "error": "error_handler"}
+    workflow.add_conditional_edges("llm_analysis", route_llm_call_node, llm_call_routes)
     
     workflow.add_conditional_edges(
         "validation",
-        route_decision_node,
+        partial(route_decision_node, graph_config=graph_config),
         {
             "success": "success",
             "refactor": "refactor", 
+            "escalate": "escalate",
             "error": "error_handler"
         }
     )
     
-    workflow.add_edge("refactor", "validation")
+    workflow.add_conditional_edges("refactor", route_llm_call_node, llm_call_routes)
+    workflow.add_edge("escalate", "llm_analysis")
     workflow.add_edge("success", END)
     workflow.add_edge("error_handler", END)
     
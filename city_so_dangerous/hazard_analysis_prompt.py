@@ -16,7 +16,8 @@ Analyze the image and identify all visible hazards. Return a JSON object with th
       "degree_of_risk": "LOW",
       "description": "Heavy traffic or road hazards"
     }
-  }
+  },
+  "confidence_score": 0.85
 }
 
 HAZARD TYPES: FIRE, CRIME, TRAFFIC, WEATHER, CONSTRUCTION, FLOOD, EARTHQUAKE, OTHER
@@ -26,6 +27,7 @@ Rules:
 - Only include hazards you can actually see in the image
 - Use exact enum values for hazard types and risk levels
 - Provide clear, specific descriptions
+- Set confidence_score (0.0-1.0) to how certain you are of the whole analysis
 - Return valid JSON only"""
 
 REFACTOR_PROMPT = """Fix this JSON to match the required schema. The JSON has formatting issues.
@@ -37,10 +39,15 @@ Required schema:
       "degree_of_risk": "RISK_LEVEL",
       "description": "description text"
     }
-  }
+  },
+  "confidence_score": CONFIDENCE_SCORE
 }
 
 Fix the malformed JSON below:
 {json_text}
 
+Rules:
+- Keep the original confidence_score value (0.0-1.0) unchanged
+- If the original has no confidence_score, omit the field; do not invent one
+
 Return only the corrected JSON."""
\ No newline at end of file
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, TypedDict
+from PIL import Image
+
+# EXIF 태그 번호
+_EXIF_IFD = 0x8769
+_GPS_IFD = 0x8825
+_DATETIME = 306
+_DATETIME_ORIGINAL = 36867
+_OFFSET_TIME_ORIGINAL = 36881
+_GPS_LATITUDE_REF = 1
+_GPS_LATITUDE = 2
+_GPS_LONGITUDE_REF = 3
+_GPS_LONGITUDE = 4
+
+
+class ImageMetadata(TypedDict):
+    latitude: Optional[float]
+    longitude: Optional[float]
+    taken_at: Optional[float]  # 촬영 시각 (epoch seconds)
+
+
+def extract_image_metadata(image: Image.Image) -> ImageMetadata:
+    """
+    이미지 EXIF에서 GPS 좌표와 촬영 시각 추출 (없거나 깨진 값은 None)
+
+    촬영 시각에 OffsetTimeOriginal이 없으면 UTC로 간주합니다.
+    """
+    metadata: ImageMetadata = {"latitude": None, "longitude": None, "taken_at": None}
+    try:
+        exif = image.getexif()
+    except Exception:
+        return metadata
+
+    try:
+        gps = exif.get_ifd(_GPS_IFD)
+        metadata["latitude"] = _gps_coordinate(gps.get(_GPS_LATITUDE), gps.get(_GPS_LATITUDE_REF), "S")
+        metadata["longitude"] = _gps_coordinate(gps.get(_GPS_LONGITUDE), gps.get(_GPS_LONGITUDE_REF), "W")
+    except Exception:
+        pass
+
+    try:
+        exif_ifd = exif.get_ifd(_EXIF_IFD)
+        metadata["taken_at"] = _exif_timestamp(
+            exif_ifd.get(_DATETIME_ORIGINAL) or exif.get(_DATETIME),
+            exif_ifd.get(_OFFSET_TIME_ORIGINAL),
+        )
+    except Exception:
+        pass
+
+    return metadata
+
+
+def _gps_coordinate(dms: Any, ref: Any, negative_ref: str) -> Optional[float]:
+    """(도, 분, 초) 유리수 튜플을 십진수 좌표로 변환"""
+    if not dms or len(dms) != 3:
+        return None
+
+    degrees, minutes, seconds = (float(part) for part in dms)
+    value = degrees + minutes / 60 + seconds / 3600
+    if isinstance(ref, bytes):
+        ref = ref.decode("ascii", "ignore")
+    if isinstance(ref, str) and ref.strip().upper() == negative_ref:
+        value = -value
+    return value
+
+
+def _exif_timestamp(value: Any, offset: Any) -> Optional[float]:
+    """EXIF 날짜 문자열 (YYYY:MM:DD HH:MM:SS, offset은 +09:00 형식)을 epoch seconds로 변환"""
+    if not isinstance(value, str):
+        return None
+
+    taken_at = datetime.strptime(value.strip("\x00 "), "%Y:%m:%d %H:%M:%S")
+
+    tz = timezone.utc
+    if isinstance(offset, str) and len(offset.strip("\x00 ")) == 6:
+        offset = offset.strip("\x00 ")
+        sign = -1 if offset[0] == "-" else 1
+        tz = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6])))
+
+    return taken_at.replace(tzinfo=tz).timestamp()
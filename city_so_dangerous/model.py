@@ -46,14 +46,31 @@ class HazardAnalysisState(TypedDict):
     needs_retry: bool  # Flag for retry logic
     retry_count: int  # Number of retries attempted
     error: Optional[str]  # Error message if any
+    model_used: Optional[str]  # LLM model that produced raw_analysis
+    cascade_tier: int  # Index into GraphConfig.cascade_models
+    tier_started_at: Optional[float]  # perf_counter() when the current tier started
 
 
 class GraphConfig(BaseModel):
     """Configuration for the analysis graph"""
     max_retries: int = Field(default=2, description="Maximum retry attempts")
-    llm_model: str = Field(default="gpt-4o", description="LLM model to use")
+    fast_llm_model: Optional[str] = Field(
+        default="gemini-2.0-flash",
+        description="Cheap first-tier model (None disables the cascade)"
+    )
+    llm_model: str = Field(
+        default="gemini-2.5-pro",
+        description="Stronger model used when the fast model is unsure"
+    )
     temperature: float = Field(default=0.1, description="LLM temperature")
     confidence_threshold: float = Field(
         default=0.7, 
         description="Minimum confidence score to accept result"
-    )
\ No newline at end of file
+    )
+
+    @property
+    def cascade_models(self) -> List[str]:
+        """Models in escalation order"""
+        if self.fast_llm_model and self.fast_llm_model != self.llm_model:
+            return [self.fast_llm_model, self.llm_model]
+        return [self.llm_model]
\ No newline at end of file
@@ -1,27 +1,56 @@
 import json
+import time
 from dotenv import load_dotenv
 from typing import Literal
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage
-from .model import HazardAnalysisState, AnalysisResult, HazardType, DegreeOfRisk
+from .model import HazardAnalysisState, AnalysisResult, HazardType, DegreeOfRisk, GraphConfig
 from .hazard_analysis_prompt import SYSTEM_PROMPT, REFACTOR_PROMPT
+from .cascade import needs_escalation, cascade_stats
+from .circuit_breaker import llm_circuit_breaker
 
 load_dotenv()
 
 
-def llm_analysis_node(state: HazardAnalysisState) -> dict:
-    llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash", temperature=0.1)
+def _tier_model(state: HazardAnalysisState, graph_config: GraphConfig) -> str:
+    models = graph_config.cascade_models
+    return models[min(state.get("cascade_tier", 0), len(models) - 1)]
+
+
+def _record_tier(state: HazardAnalysisState, outcome: str) -> None:
+    started = state.get("tier_started_at")
+    if state.get("model_used") and started is not None:
+        cascade_stats.record(state["model_used"], outcome, (time.perf_counter() - started) * 1000)
+
+
+def _can_fall_back(state: HazardAnalysisState) -> bool:
+    """하위 단계에서 검증된 결과가 있어 상위 단계가 실패해도 그 결과를 쓸 수 있으면 True"""
+    return state.get("validated_result") is not None and state.get("cascade_tier", 0) > 0
+
+
+def llm_analysis_node(state: HazardAnalysisState, graph_config: GraphConfig) -> dict:
+    model = _tier_model(state, graph_config)
+    started = time.perf_counter()
+    llm = ChatGoogleGenerativeAI(model=model, temperature=graph_config.temperature)
     
     message = HumanMessage(content=[
         {"type": "text", "text": SYSTEM_PROMPT},
         {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{state['image_data']}"}}
     ])
     
-    response = llm.invoke([message])
+    try:
+        response = llm_circuit_breaker.call(llm.invoke, [message])
+    except Exception as e:
+        if not _can_fall_back(state):
+            raise
+        return {"error": str(e), "needs_retry": True, "model_used": model, "tier_started_at": started}
     
     return {
         "messages": state["messages"] + [message, response],
-        "raw_analysis": {"content": response.content}
+        "raw_analysis": {"content": response.content},
+        "model_used": model,
+        "tier_started_at": started,
+        "error": None
     }
 
 
@@ -58,30 +87,68 @@ def validation_node(state: HazardAnalysisState) -> dict:
         }
 
 
-def refactor_node(state: HazardAnalysisState) -> dict:
-    llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash", temperature=0)
+def refactor_node(state: HazardAnalysisState, graph_config: GraphConfig) -> dict:
+    llm = ChatGoogleGenerativeAI(model=_tier_model(state, graph_config), temperature=0)
     
     content = state["raw_analysis"]["content"]
-    prompt = REFACTOR_PROMPT.format(json_text=content)
+    # 프롬프트의 JSON 예시 중괄호 때문에 str.format() 대신 치환 사용
+    prompt = REFACTOR_PROMPT.replace("{json_text}", content)
     
-    response = llm.invoke([HumanMessage(content=prompt)])
+    try:
+        response = llm_circuit_breaker.call(llm.invoke, [HumanMessage(content=prompt)])
+    except Exception as e:
+        if not _can_fall_back(state):
+            raise
+        return {"error": str(e), "needs_retry": True}
     
     return {
-        "raw_analysis": {"content": response.content}
+        "raw_analysis": {"content": response.content},
+        "error": None
     }
 
 
-def route_decision_node(state: HazardAnalysisState) -> Literal["success", "refactor", "error"]:
+def route_llm_call_node(state: HazardAnalysisState) -> Literal["validation", "error"]:
+    # LLM 호출이 실패했으면 (하위 단계 결과로 대체 가능한 경우만 여기까지 옴) 바로 error_handler로
+    return "validation" if state.get("error") is None else "error"
+
+
+def route_decision_node(
+    state: HazardAnalysisState, graph_config: GraphConfig
+) -> Literal["success", "refactor", "escalate", "error"]:
+    can_escalate = state.get("cascade_tier", 0) < len(graph_config.cascade_models) - 1
+
     if not state["needs_retry"]:
+        if can_escalate and needs_escalation(state["validated_result"], graph_config.confidence_threshold):
+            return "escalate"
         return "success"
     
-    if state["retry_count"] >= 2:
-        return "error"
+    if state["retry_count"] >= graph_config.max_retries:
+        # 빠른 모델이 형식을 못 맞추면 실패 처리 대신 상위 모델에 맡김
+        return "escalate" if can_escalate else "error"
         
     return "refactor"
 
 
-def error_handler_node(state: HazardAnalysisState) -> dict:
+def escalate_node(state: HazardAnalysisState) -> dict:
+    _record_tier(state, "escalated")
+    return {
+        "cascade_tier": state.get("cascade_tier", 0) + 1,
+        "needs_retry": False,
+        "retry_count": 0,
+        "error": None
+    }
+
+
+def error_handler_node(state: HazardAnalysisState, graph_config: GraphConfig) -> dict:
+    _record_tier(state, "failed")
+
+    # 상위 모델이 실패해도 하위 단계에서 검증된 결과가 있으면 그 결과를 사용
+    if _can_fall_back(state):
+        return {
+            "model_used": graph_config.cascade_models[state["cascade_tier"] - 1],
+            "needs_retry": False
+        }
+
     return {
         "validated_result": AnalysisResult(
             hazards={
@@ -96,4 +163,5 @@ def error_handler_node(state: HazardAnalysisState) -> dict:
 
 
 def success_node(state: HazardAnalysisState) -> dict:
+    _record_tier(state, "accepted")
     return {"needs_retry": False}
\ No newline at end of file
@@ -0,0 +1,321 @@
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Protocol, Tuple, TypedDict, Union
+
+from .engine_io import EngineOutput, HazardType, DegreeOfRisk, safe_enum_lookup
+from .image_metadata import ImageMetadata
+
+
+class ResultSink(Protocol):
+    """analyze_image의 result_sink가 구현해야 하는 인터페이스"""
+
+    def record(
+        self,
+        output: EngineOutput,
+        image_hash: str,
+        source_id: Optional[str] = None,
+        model: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        metadata: Optional[ImageMetadata] = None,
+    ) -> None:
+        ...
+
+
+class HazardRecord(TypedDict):
+    """저장소에서 조회된 위험 요소 한 건"""
+    analysis_id: int
+    image_hash: str
+    source_id: Optional[str]
+    timestamp: float
+    model: Optional[str]
+    latency_ms: Optional[float]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    taken_at: Optional[float]
+    hazard_type: HazardType
+    degree_of_risk: DegreeOfRisk
+    description: str
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY,
+    image_hash TEXT NOT NULL,
+    source_id TEXT,
+    timestamp REAL NOT NULL,
+    model TEXT,
+    latency_ms REAL,
+    latitude REAL,
+    longitude REAL,
+    taken_at REAL
+);
+CREATE TABLE IF NOT EXISTS hazards (
+    analysis_id INTEGER NOT NULL REFERENCES analyses(id),
+    hazard_type TEXT NOT NULL,
+    degree_of_risk TEXT NOT NULL,
+    description TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    source_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_hazards_type_risk_ts
+    ON hazards (hazard_type, degree_of_risk, timestamp);
+CREATE INDEX IF NOT EXISTS idx_hazards_source_ts
+    ON hazards (source_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_analyses_source_ts
+    ON analyses (source_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_analyses_image_hash
+    ON analyses (image_hash);
+"""
+
+# 초기 스키마 이후 analyses에 추가된 컬럼 (기존 DB는 열 때 ALTER TABLE로 보강)
+_ANALYSES_ADDED_COLUMNS = (
+    ("latitude", "REAL"),
+    ("longitude", "REAL"),
+    ("taken_at", "REAL"),
+)
+
+_HAZARD_COLUMNS = (
+    "a.id, a.image_hash, a.source_id, a.timestamp, a.model, a.latency_ms, "
+    "a.latitude, a.longitude, a.taken_at, h.hazard_type, h.degree_of_risk, h.description"
+)
+
+
+class ResultStore:
+    """
+    analyze_image 결과를 로컬 SQLite에 저장하는 결과 싱크
+
+    record()는 메모리 버퍼에만 쌓고, batch_size개가 모이거나 가장 오래된 결과가 max_buffer_age초를
+    넘기면 하나의 트랜잭션으로 기록합니다 (나이 검사는 record() 호출 시점에 수행).
+    조회 전에는 버퍼가 자동으로 flush 됩니다.
+    """
+
+    def __init__(self, path: str = "results.db", batch_size: int = 1000, max_buffer_age: float = 5.0):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.max_buffer_age = max_buffer_age
+        self._lock = threading.Lock()
+        self._buffer: List[Tuple[Tuple[Any, ...], List[Tuple[str, str, str]]]] = []
+        # 버퍼에 첫 결과가 들어간 시각 (time.monotonic())
+        self._buffer_started_at = 0.0
+        # 분석기가 워커 스레드에서 호출될 수 있으므로 연결 공유를 허용하고 lock으로 보호
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """이전 버전에서 만든 DB에 없는 컬럼 추가"""
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(analyses)")}
+        with self._conn:
+            for name, column_type in _ANALYSES_ADDED_COLUMNS:
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE analyses ADD COLUMN {name} {column_type}")
+
+    def record(
+        self,
+        output: EngineOutput,
+        image_hash: str,
+        source_id: Optional[str] = None,
+        model: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        timestamp: Optional[float] = None,
+        metadata: Optional[ImageMetadata] = None,
+    ) -> None:
+        """분석 결과 한 건을 버퍼에 추가 (가득 차면 flush)"""
+        ts = time.time() if timestamp is None else timestamp
+        metadata = metadata or {}
+        hazards = [
+            (_enum_value(hazard_type), _enum_value(info.get("degree_of_risk")), info.get("description", ""))
+            for hazard_type, info in (output.get("hazards") or {}).items()
+        ]
+
+        with self._lock:
+            if not self._buffer:
+                self._buffer_started_at = time.monotonic()
+            self._buffer.append((
+                (
+                    image_hash, source_id, ts, model, latency_ms,
+                    metadata.get("latitude"), metadata.get("longitude"), metadata.get("taken_at"),
+                ),
+                hazards,
+            ))
+            if (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._buffer_started_at >= self.max_buffer_age
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """버퍼에 쌓인 결과를 하나의 트랜잭션으로 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+
+        buffer, self._buffer = self._buffer, []
+        with self._conn:
+            cursor = self._conn.cursor()
+            hazard_rows = []
+            for analysis_row, hazards in buffer:
+                cursor.execute(
+                    "INSERT INTO analyses (image_hash, source_id, timestamp, model, latency_ms, "
+                    "latitude, longitude, taken_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    analysis_row,
+                )
+                analysis_id = cursor.lastrowid
+                source_id, ts = analysis_row[1], analysis_row[2]
+                hazard_rows.extend(
+                    (analysis_id, hazard_type, risk, description, ts, source_id)
+                    for hazard_type, risk, description in hazards
+                )
+            cursor.executemany(
+                "INSERT INTO hazards (analysis_id, hazard_type, degree_of_risk, description, timestamp, source_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                hazard_rows,
+            )
+
+    def query_hazards(
+        self,
+        hazard_type: Union[HazardType, str, None] = None,
+        degree_of_risk: Union[DegreeOfRisk, str, None] = None,
+        source_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[HazardRecord]:
+        """
+        조건에 맞는 위험 요소를 최신순으로 조회
+
+        예: 최근 1시간의 HIGH FIRE
+            store.query_hazards(HazardType.FIRE, DegreeOfRisk.HIGH, since=time.time() - 3600)
+        """
+        where, params = self._build_filter(hazard_type, degree_of_risk, source_id, since, until)
+        sql = (
+            f"SELECT {_HAZARD_COLUMNS} FROM hazards h JOIN analyses a ON a.id = h.analysis_id"
+            f"{where} ORDER BY h.timestamp DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [_row_to_record(row) for row in rows]
+
+    def count_hazards(
+        self,
+        hazard_type: Union[HazardType, str, None] = None,
+        degree_of_risk: Union[DegreeOfRisk, str, None] = None,
+        source_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> int:
+        """조건에 맞는 위험 요소 개수"""
+        where, params = self._build_filter(hazard_type, degree_of_risk, source_id, since, until)
+        with self._lock:
+            self._flush_locked()
+            (count,) = self._conn.execute(f"SELECT COUNT(*) FROM hazards h{where}", params).fetchone()
+        return count
+
+    def latest_for_source(self, source_id: str) -> Optional[EngineOutput]:
+        """
+        소스의 가장 최근 정상 분석 결과를 EngineOutput 형태로 반환
+
+        위험 요소가 하나도 기록되지 않은 분석(오류 응답)은 건너뜁니다.
+        """
+        with self._lock:
+            self._flush_locked()
+            # hazards 테이블에서 찾으므로 위험 요소가 있는 분석만 대상이 됨
+            row = self._conn.execute(
+                "SELECT analysis_id, timestamp FROM hazards WHERE source_id = ? "
+                "ORDER BY timestamp DESC, analysis_id DESC LIMIT 1",
+                (source_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            # analysis_id 전용 인덱스 없이 (source_id, timestamp) 인덱스로 찾음
+            hazard_rows = self._conn.execute(
+                "SELECT hazard_type, degree_of_risk, description FROM hazards "
+                "WHERE source_id = ? AND timestamp = ? AND analysis_id = ?",
+                (source_id, row[1], row[0]),
+            ).fetchall()
+
+        return {
+            "hazards": {
+                safe_enum_lookup(HazardType, hazard_type, HazardType.OTHER): {
+                    "degree_of_risk": safe_enum_lookup(DegreeOfRisk, risk, DegreeOfRisk.LOW),
+                    "description": description,
+                }
+                for hazard_type, risk, description in hazard_rows
+            }
+        }
+
+    def close(self) -> None:
+        """남은 버퍼를 기록하고 연결 종료"""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _build_filter(hazard_type, degree_of_risk, source_id, since, until) -> Tuple[str, List[Any]]:
+        """조건 컬럼 순서를 인덱스 (hazard_type, degree_of_risk, timestamp) 순서에 맞춰 구성"""
+        clauses: List[str] = []
+        params: List[Any] = []
+
+        if hazard_type is not None:
+            clauses.append("h.hazard_type = ?")
+            params.append(_enum_value(safe_enum_lookup(HazardType, hazard_type, hazard_type)))
+        if degree_of_risk is not None:
+            clauses.append("h.degree_of_risk = ?")
+            params.append(_enum_value(safe_enum_lookup(DegreeOfRisk, degree_of_risk, degree_of_risk)))
+        if source_id is not None:
+            clauses.append("h.source_id = ?")
+            params.append(source_id)
+        if since is not None:
+            clauses.append("h.timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("h.timestamp < ?")
+            params.append(until)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+
+def _enum_value(value: Any) -> str:
+    """Enum이면 value, 아니면 문자열 그대로 저장"""
+    return value.value if hasattr(value, "value") else str(value)
+
+
+def _row_to_record(row: Tuple[Any, ...]) -> HazardRecord:
+    (
+        analysis_id, image_hash, source_id, ts, model, latency_ms,
+        latitude, longitude, taken_at, hazard_type, risk, description,
+    ) = row
+    return {
+        "analysis_id": analysis_id,
+        "image_hash": image_hash,
+        "source_id": source_id,
+        "timestamp": ts,
+        "model": model,
+        "latency_ms": latency_ms,
+        "latitude": latitude,
+        "longitude": longitude,
+        "taken_at": taken_at,
+        "hazard_type": safe_enum_lookup(HazardType, hazard_type, HazardType.OTHER),
+        "degree_of_risk": safe_enum_lookup(DegreeOfRisk, risk, DegreeOfRisk.LOW),
+        "description": description,
+    }
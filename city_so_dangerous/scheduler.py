@@ -0,0 +1,220 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+from .analyzer import analyze_image
+from .engine_io import EngineOutput, DegreeOfRisk, safe_enum_lookup
+
+
+class Priority(Enum):
+    CRITICAL = "critical"
+    HIGH = "high"
+    NORMAL = "normal"
+    LOW = "low"
+
+
+# 높은 우선순위부터
+_PRIORITY_ORDER = list(Priority)
+
+DEFAULT_LANE_WEIGHTS: Dict[Priority, int] = {
+    Priority.CRITICAL: 8,
+    Priority.HIGH: 4,
+    Priority.NORMAL: 2,
+    Priority.LOW: 1,
+}
+
+# 마지막 결과에 이 위험도가 있던 source는 해당 lane 이상으로 자동 승격
+PROMOTION_BY_RISK: Dict[DegreeOfRisk, Priority] = {
+    DegreeOfRisk.CRITICAL: Priority.CRITICAL,
+    DegreeOfRisk.HIGH: Priority.HIGH,
+}
+
+# (대기 시작 시각, future, image_bytes, source_id, analyze 추가 인자)
+_Job = Tuple[float, Future, bytes, Optional[str], Dict[str, Any]]
+
+
+class AnalysisScheduler:
+    """
+    analyze_image 앞단의 가중치 기반 우선순위 스케줄러
+
+    작업은 Priority lane에 들어가고, max_workers개의 워커가 lane 가중치 비율(smooth weighted
+    round-robin)로 꺼내 분석합니다. 호출자가 준 priority와 source의 마지막 결과에 따른 승격 중
+    높은 쪽 lane을 사용합니다. starvation_timeout 이상 기다린 작업은 가중치 디스패치
+    starved_dispatch_interval번마다 한 번씩 lane과 무관하게 가장 오래된 것부터 처리되므로,
+    밀린 낮은 lane도 일정 몫을 보장받지만 새로 들어온 높은 lane 작업을 막지는 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        lane_weights: Optional[Dict[Priority, int]] = None,
+        starvation_timeout: float = 30.0,
+        starved_dispatch_interval: int = 4,
+        analyze: Callable[..., EngineOutput] = analyze_image,
+        max_wait_samples: int = 10000,
+    ):
+        self.lane_weights = {**DEFAULT_LANE_WEIGHTS, **(lane_weights or {})}
+        self.starvation_timeout = starvation_timeout
+        self.starved_dispatch_interval = max(0, starved_dispatch_interval)
+        self._analyze = analyze
+        self._cond = threading.Condition()
+        self._lanes: Dict[Priority, Deque[_Job]] = {lane: deque() for lane in _PRIORITY_ORDER}
+        self._current_weight: Dict[Priority, int] = {lane: 0 for lane in _PRIORITY_ORDER}
+        self._source_priority: Dict[str, Priority] = {}
+        self._waits_ms: Dict[Priority, Deque[float]] = {
+            lane: deque(maxlen=max_wait_samples) for lane in _PRIORITY_ORDER
+        }
+        self._dispatched: Dict[Priority, int] = {lane: 0 for lane in _PRIORITY_ORDER}
+        self._starvation_dispatches = 0
+        # 마지막 starvation 디스패치 이후 가중치 디스패치 횟수
+        self._weighted_since_starved = self.starved_dispatch_interval
+        self._shutdown = False
+        self._workers = [
+            threading.Thread(target=self._worker, name=f"analysis-scheduler-{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(
+        self,
+        image_bytes: bytes,
+        source_id: Optional[str] = None,
+        priority: Union[Priority, str] = Priority.NORMAL,
+        **analyze_kwargs: Any,
+    ) -> "Future[EngineOutput]":
+        """분석 작업을 lane에 넣고 결과 Future 반환"""
+        lane = self.effective_priority(source_id, priority)
+        future: "Future[EngineOutput]" = Future()
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("scheduler가 이미 종료되었습니다")
+            self._lanes[lane].append((time.monotonic(), future, image_bytes, source_id, analyze_kwargs))
+            self._cond.notify()
+
+        return future
+
+    def effective_priority(self, source_id: Optional[str], priority: Union[Priority, str] = Priority.NORMAL) -> Priority:
+        """호출자 priority와 source 자동 승격 중 높은 lane"""
+        requested = safe_enum_lookup(Priority, priority, Priority.NORMAL)
+        promoted = self._source_priority.get(source_id) if source_id is not None else None
+        if promoted is None:
+            return requested
+        return min(requested, promoted, key=_PRIORITY_ORDER.index)
+
+    def stats(self) -> Dict[str, Any]:
+        """lane별 대기 작업 수, 처리 수, 대기시간(ms) p50 / p95 / 최대"""
+        now = time.monotonic()
+        with self._cond:
+            lanes = {}
+            for lane in _PRIORITY_ORDER:
+                waits = sorted(self._waits_ms[lane])
+                queue = self._lanes[lane]
+                lanes[lane.value] = {
+                    "weight": self.lane_weights[lane],
+                    "queued": len(queue),
+                    "dispatched": self._dispatched[lane],
+                    "oldest_wait_ms": (now - queue[0][0]) * 1000 if queue else 0.0,
+                    "wait_p50_ms": _percentile(waits, 0.5),
+                    "wait_p95_ms": _percentile(waits, 0.95),
+                    "wait_max_ms": waits[-1] if waits else None,
+                }
+            return {
+                "lanes": lanes,
+                "starvation_dispatches": self._starvation_dispatches,
+                "promoted_sources": len(self._source_priority),
+            }
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """새 작업을 막고 워커 종료 (cancel_pending이면 대기 중인 작업 취소)"""
+        with self._cond:
+            self._shutdown = True
+            if cancel_pending:
+                for queue in self._lanes.values():
+                    while queue:
+                        queue.popleft()[1].cancel()
+            self._cond.notify_all()
+
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def __enter__(self) -> "AnalysisScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._shutdown and not any(self._lanes.values()):
+                    self._cond.wait()
+                if not any(self._lanes.values()):
+                    return
+                _, future, image_bytes, source_id, analyze_kwargs = self._next_job_locked()
+
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                result = self._analyze(image_bytes, source_id=source_id, **analyze_kwargs)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+
+            self._update_source_priority(source_id, result)
+            future.set_result(result)
+
+    def _next_job_locked(self) -> _Job:
+        now = time.monotonic()
+        ready = [lane for lane in _PRIORITY_ORDER if self._lanes[lane]]
+
+        # starvation 방지: 가중치 디스패치 starved_dispatch_interval번마다 가장 오래된 작업 하나
+        starved = []
+        if self._weighted_since_starved >= self.starved_dispatch_interval:
+            starved = [lane for lane in ready if now - self._lanes[lane][0][0] >= self.starvation_timeout]
+        if starved:
+            lane = min(starved, key=lambda item: self._lanes[item][0][0])
+            self._starvation_dispatches += 1
+            self._weighted_since_starved = 0
+        else:
+            # smooth weighted round-robin (대기 작업이 있는 lane끼리)
+            total = 0
+            for item in ready:
+                self._current_weight[item] += self.lane_weights[item]
+                total += self.lane_weights[item]
+            lane = max(ready, key=lambda item: self._current_weight[item])
+            self._current_weight[lane] -= total
+            self._weighted_since_starved += 1
+
+        job = self._lanes[lane].popleft()
+        self._waits_ms[lane].append((now - job[0]) * 1000)
+        self._dispatched[lane] += 1
+        return job
+
+    def _update_source_priority(self, source_id: Optional[str], result: EngineOutput) -> None:
+        if source_id is None or "hazards" not in result:
+            return
+
+        promoted = None
+        for info in result["hazards"].values():
+            lane = PROMOTION_BY_RISK.get(info.get("degree_of_risk"))
+            if lane is not None and (promoted is None or _PRIORITY_ORDER.index(lane) < _PRIORITY_ORDER.index(promoted)):
+                promoted = lane
+
+        with self._cond:
+            if promoted is None:
+                self._source_priority.pop(source_id, None)
+            else:
+                self._source_priority[source_id] = promoted
+
+
+def _percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
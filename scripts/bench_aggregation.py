@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+HazardAggregator 벤치마크 스크립트 - 벡터 집계 vs dict 기반 Python 루프
+
+사용법:
+    python scripts/bench_aggregation.py                    # 10M 위험 요소 (기본값)
+    python scripts/bench_aggregation.py --rows 1000000
+    python scripts/bench_aggregation.py --naive-rows 200000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from collections import defaultdict
+
+import numpy as np
+
+from city_so_dangerous.aggregation import HazardAggregator
+from city_so_dangerous.engine_io import HazardType, DegreeOfRisk, HAZARD_TYPE_CODES, DEGREE_OF_RISK_CODES
+
+
+def synthetic_columns(rows, seed):
+    """서울 주변 약 0.5도 범위, 최근 30일에 분포한 임의의 위험 요소"""
+    rng = np.random.default_rng(seed)
+    now = int(time.time())
+    return {
+        "hazard_type": rng.integers(0, len(HAZARD_TYPE_CODES), rows, dtype=np.uint8),
+        "degree_of_risk": rng.integers(0, len(DEGREE_OF_RISK_CODES), rows, dtype=np.uint8),
+        "latitude": rng.uniform(37.3, 37.8, rows).astype(np.float32),
+        "longitude": rng.uniform(126.7, 127.2, rows).astype(np.float32),
+        "timestamp": rng.integers(now - 30 * 86400, now, rows, dtype=np.int64),
+    }
+
+
+def naive_aggregate(columns, rows, cell_size_deg, time_bucket_seconds):
+    """기존 방식: 결과 dict를 순회하며 HazardType 키 dict에 누적"""
+    hazard_types = list(HazardType)
+    risks = list(DegreeOfRisk)
+    results = [
+        {
+            "hazards": {
+                hazard_types[columns["hazard_type"][i]]: {
+                    "degree_of_risk": risks[columns["degree_of_risk"][i]],
+                    "description": "",
+                }
+            },
+            "latitude": float(columns["latitude"][i]),
+            "longitude": float(columns["longitude"][i]),
+            "timestamp": int(columns["timestamp"][i]),
+        }
+        for i in range(rows)
+    ]
+
+    started = time.perf_counter()
+    heatmap = defaultdict(int)
+    max_risk = {}
+    trend = defaultdict(lambda: defaultdict(int))
+    for result in results:
+        cell = (int(result["latitude"] // cell_size_deg), int(result["longitude"] // cell_size_deg))
+        for hazard_type, info in result["hazards"].items():
+            heatmap[cell] += 1
+            code = DEGREE_OF_RISK_CODES[info["degree_of_risk"]]
+            max_risk[cell] = max(max_risk.get(cell, -1), code)
+            trend[hazard_type][result["timestamp"] // time_bucket_seconds] += 1
+    return time.perf_counter() - started
+
+
+def timed(label, fn):
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<32} {elapsed:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HazardAggregator 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="위험 요소 행 수")
+    parser.add_argument("--naive-rows", type=int, default=500_000, help="Python 루프 비교에 쓸 행 수")
+    parser.add_argument("--cell-size", type=float, default=0.005, help="격자 크기(도)")
+    parser.add_argument("--bucket", type=int, default=3600, help="시간 구간(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    columns = synthetic_columns(args.rows, args.seed)
+    aggregator = HazardAggregator(cell_size_deg=args.cell_size, time_bucket_seconds=args.bucket)
+
+    print(f"벡터 집계 ({args.rows:,}행):")
+    timed("extend + columns()", lambda: (aggregator.extend(**columns), aggregator.columns()))
+    heatmap = timed("heatmap (전체)", lambda: aggregator.heatmap())
+    timed("heatmap (FIRE, HIGH 이상)", lambda: aggregator.heatmap(HazardType.FIRE, DegreeOfRisk.HIGH))
+    timed("trend (HazardType x 시간)", lambda: aggregator.trend())
+
+    path = os.path.join(tempfile.mkdtemp(), "aggregates.npz")
+    groups = timed("export_npz", lambda: aggregator.export_npz(path))
+    raw_bytes = sum(values.nbytes for values in aggregator.columns().values())
+    print(f"  heatmap 셀 {heatmap['counts'].size:,}개, export 그룹 {groups:,}개")
+    print(f"  컬럼 메모리 {raw_bytes / 1e6:,.1f} MB, export 파일 {os.path.getsize(path) / 1e6:,.1f} MB")
+
+    naive_rows = min(args.naive_rows, args.rows)
+    elapsed = naive_aggregate(columns, naive_rows, args.cell_size, args.bucket)
+    print(f"dict 기반 Python 루프 ({naive_rows:,}행): {elapsed:.3f} s "
+          f"-> {args.rows:,}행 환산 약 {elapsed * args.rows / naive_rows:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+EngineOutput 코덱 벤치마크 스크립트 - 내장 JSON / 바이너리 코덱 vs 단순 JSON 변환
+
+사용법:
+    python scripts/bench_engine_io.py
+    python scripts/bench_engine_io.py --count 500000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from city_so_dangerous.engine_io import (
+    HazardType,
+    DegreeOfRisk,
+    engine_output_validator,
+    engine_output_to_json,
+    engine_output_from_json,
+    engine_outputs_to_bytes,
+    engine_outputs_from_bytes,
+)
+
+DESCRIPTIONS = [
+    "화재 위험이 감지되었습니다.",
+    "Smoke rising from the second floor window",
+    "강풍으로 간판이 흔들리고 있습니다.",
+    "Crowd gathering near the intersection at night",
+]
+
+
+def synthetic_outputs(count, seed):
+    rng = random.Random(seed)
+    return [
+        {
+            "hazards": {
+                hazard_type: {
+                    "degree_of_risk": rng.choice(list(DegreeOfRisk)),
+                    "description": rng.choice(DESCRIPTIONS),
+                }
+                for hazard_type in rng.sample(list(HazardType), rng.randint(1, 3))
+            }
+        }
+        for _ in range(count)
+    ]
+
+
+def naive_encode(output):
+    """소비자마다 작성하던 변환: Enum -> 문자열 후 기본 json.dumps"""
+    return json.dumps({
+        "hazards": {
+            hazard_type.value: {
+                "degree_of_risk": info["degree_of_risk"].value,
+                "description": info["description"],
+            }
+            for hazard_type, info in output["hazards"].items()
+        }
+    })
+
+
+def naive_decode(text):
+    return engine_output_validator.validate_and_convert(json.loads(text))
+
+
+def report(label, count, encode_seconds, decode_seconds, size):
+    print(f"  {label:<28} encode {count / encode_seconds:>10,.0f}/s  "
+          f"decode {count / decode_seconds:>10,.0f}/s  {size / count:7.1f} B/건")
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EngineOutput 코덱 벤치마크")
+    parser.add_argument("--count", type=int, default=200_000, help="EngineOutput 개수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    outputs = synthetic_outputs(args.count, args.seed)
+    print(f"EngineOutput {args.count:,}건:")
+
+    encoded, encode_seconds = timed(lambda: [naive_encode(output) for output in outputs])
+    decoded, decode_seconds = timed(lambda: [naive_decode(text) for text in encoded])
+    assert decoded == outputs
+    report("단순 JSON + SchemaValidator", args.count, encode_seconds, decode_seconds,
+           sum(len(text.encode("utf-8")) for text in encoded))
+
+    encoded, encode_seconds = timed(lambda: [engine_output_to_json(output) for output in outputs])
+    decoded, decode_seconds = timed(lambda: [engine_output_from_json(text) for text in encoded])
+    assert decoded == outputs
+    report("engine_output_to/from_json", args.count, encode_seconds, decode_seconds,
+           sum(len(text.encode("utf-8")) for text in encoded))
+
+    encoded, encode_seconds = timed(lambda: engine_outputs_to_bytes(outputs))
+    decoded, decode_seconds = timed(lambda: engine_outputs_from_bytes(encoded))
+    assert decoded == outputs
+    report("engine_outputs_to/from_bytes", args.count, encode_seconds, decode_seconds, len(encoded))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+ResultStore 벤치마크 스크립트 - 삽입 속도와 조회 지연시간 측정
+
+사용법:
+    python scripts/bench_result_store.py                 # 10M 행 (기본값)
+    python scripts/bench_result_store.py --rows 1000000
+    python scripts/bench_result_store.py --db bench.db --batch-size 5000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from city_so_dangerous.engine_io import HazardType, DegreeOfRisk
+from city_so_dangerous.result_store import ResultStore
+
+
+def synthetic_output(rng):
+    """위험 요소 1~3개를 가진 임의의 EngineOutput 생성"""
+    hazard_types = rng.sample(list(HazardType), rng.randint(1, 3))
+    return {
+        "hazards": {
+            hazard_type: {
+                "degree_of_risk": rng.choice(list(DegreeOfRisk)),
+                "description": f"synthetic {hazard_type.value} hazard",
+            }
+            for hazard_type in hazard_types
+        }
+    }
+
+
+def bench_insert(store, rows, sources, span_seconds, seed):
+    """hazards 테이블이 rows 행에 도달할 때까지 분석 결과를 기록"""
+    rng = random.Random(seed)
+    outputs = [synthetic_output(rng) for _ in range(1000)]
+    now = time.time()
+
+    inserted = 0
+    analyses = 0
+    started = time.perf_counter()
+    while inserted < rows:
+        output = outputs[analyses % len(outputs)]
+        store.record(
+            output,
+            image_hash=f"{analyses:064x}",
+            source_id=f"cam-{analyses % sources}",
+            model="gemini-2.0-flash",
+            latency_ms=rng.uniform(200, 2000),
+            timestamp=now - span_seconds * (rows - inserted) / rows,
+        )
+        inserted += len(output["hazards"])
+        analyses += 1
+    store.flush()
+    elapsed = time.perf_counter() - started
+    return inserted, analyses, elapsed
+
+
+def bench_query(label, fn, repeat):
+    """조회 함수를 repeat번 실행하여 p50 / p95 지연시간(ms) 출력"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    size = len(result) if isinstance(result, (list, dict)) else result
+    print(f"  {label:<40} p50 {statistics.median(timings):8.2f} ms  p95 {p95:8.2f} ms  (결과 {size})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ResultStore 벤치마크")
+    parser.add_argument("--rows", type=int, default=10_000_000, help="삽입할 위험 요소 행 수")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="트랜잭션당 분석 결과 수")
+    parser.add_argument("--sources", type=int, default=1000, help="source_id 개수")
+    parser.add_argument("--span-hours", type=float, default=24 * 30, help="타임스탬프 분포 범위(시간)")
+    parser.add_argument("--repeat", type=int, default=20, help="조회 반복 횟수")
+    parser.add_argument("--db", help="DB 파일 경로 (기본값: 임시 파일)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), "bench_results.db")
+    print(f"DB: {db_path}")
+
+    with ResultStore(db_path, batch_size=args.batch_size) as store:
+        inserted, analyses, elapsed = bench_insert(
+            store, args.rows, args.sources, args.span_hours * 3600, args.seed
+        )
+        print(f"삽입: 위험 요소 {inserted:,}행 / 분석 {analyses:,}건, {elapsed:.1f}s "
+              f"({inserted / elapsed:,.0f} rows/s, {analyses / elapsed:,.0f} analyses/s)")
+
+        now = time.time()
+        print("조회:")
+        bench_query(
+            "HIGH FIRE, 최근 1시간",
+            lambda: store.query_hazards(HazardType.FIRE, DegreeOfRisk.HIGH, since=now - 3600),
+            args.repeat,
+        )
+        bench_query(
+            "HIGH FIRE, 최근 1시간 (count)",
+            lambda: store.count_hazards(HazardType.FIRE, DegreeOfRisk.HIGH, since=now - 3600),
+            args.repeat,
+        )
+        bench_query(
+            "source cam-7, 최근 24시간",
+            lambda: store.query_hazards(source_id="cam-7", since=now - 86400),
+            args.repeat,
+        )
+        bench_query(
+            "HIGH CRIME, 최신 100건",
+            lambda: store.query_hazards(HazardType.CRIME, DegreeOfRisk.HIGH, limit=100),
+            args.repeat,
+        )
+        bench_query(
+            "source cam-7 최신 결과",
+            lambda: store.latest_for_source("cam-7"),
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
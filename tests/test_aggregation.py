@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from city_so_dangerous.aggregation import HazardAggregator
+from city_so_dangerous.engine_io import HazardType, DegreeOfRisk, DEGREE_OF_RISK_CODES, HAZARD_TYPE_CODES
+
+
+def _output(hazard_type, degree_of_risk):
+    return {"hazards": {hazard_type: {"degree_of_risk": degree_of_risk, "description": ""}}}
+
+
+def _aggregator():
+    aggregator = HazardAggregator(cell_size_deg=0.1, time_bucket_seconds=3600)
+    gps = {"latitude": 37.55, "longitude": 126.95, "taken_at": 7200.0}
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), metadata=gps)
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.LOW), metadata=gps)
+    aggregator.record(_output(HazardType.CRIME, DegreeOfRisk.MEDIUM), metadata={**gps, "latitude": 37.75, "taken_at": 0.0})
+    # GPS 없는 결과는 heatmap에서 제외되고 trend에는 포함
+    aggregator.record(_output(HazardType.WIND, DegreeOfRisk.LOW), timestamp=3600.0)
+    return aggregator
+
+
+def test_heatmap_counts_and_max_risk():
+    heatmap = _aggregator().heatmap()
+
+    assert heatmap["counts"].shape == (3, 1)
+    assert heatmap["counts"][:, 0].tolist() == [2, 0, 1]
+    assert heatmap["max_risk"][:, 0].tolist() == [
+        DEGREE_OF_RISK_CODES[DegreeOfRisk.HIGH], -1, DEGREE_OF_RISK_CODES[DegreeOfRisk.MEDIUM]
+    ]
+    assert _aggregator().heatmap(HazardType.FIRE, min_risk="high")["counts"].sum() == 1
+
+
+def test_trend_by_hazard_type_and_bucket():
+    trend = _aggregator().trend()
+
+    assert trend["bucket_start"].tolist() == [0, 3600, 7200]
+    assert trend["counts"][HAZARD_TYPE_CODES[HazardType.FIRE]].tolist() == [0, 0, 2]
+    assert trend["counts"][HAZARD_TYPE_CODES[HazardType.WIND]].tolist() == [0, 1, 0]
+
+
+def test_export_npz_groups(tmp_path):
+    path = tmp_path / "aggregates.npz"
+    assert _aggregator().export_npz(str(path)) == 2
+
+    data = np.load(path)
+    assert data["count"].tolist() == [2, 1]
+    assert (data["lat_cell_offset"] + data["lat_cell_origin"]).tolist() == [375, 377]
+
+
+def test_outlier_does_not_blow_up_heatmap():
+    aggregator = _aggregator()
+    # EXIF 0/0으로 잘못 태깅된 사진
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.LOW), metadata={"latitude": 0.0, "longitude": 0.0})
+
+    with pytest.raises(ValueError):
+        aggregator.heatmap(max_cells=10000)
+
+    seoul = aggregator.heatmap(bounds=(37.0, 126.0, 38.0, 127.5))
+    assert seoul["counts"].shape == (10, 15)
+    assert seoul["counts"].sum() == 3
+
+    cells = aggregator.heatmap_cells()
+    assert cells["cell_lat"].tolist() == [0, 375, 377]
+    assert cells["counts"].tolist() == [1, 2, 1]
+    assert cells["max_risk"].tolist() == [
+        DEGREE_OF_RISK_CODES[DegreeOfRisk.LOW],
+        DEGREE_OF_RISK_CODES[DegreeOfRisk.HIGH],
+        DEGREE_OF_RISK_CODES[DegreeOfRisk.MEDIUM],
+    ]
+
+
+def test_heatmap_bounds_on_recorded_point():
+    aggregator = HazardAggregator(cell_size_deg=0.01)
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), metadata={"latitude": 37.51, "longitude": 127.03})
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), metadata={"latitude": 37.55, "longitude": 127.05})
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), metadata={"latitude": 37.6, "longitude": 127.1})
+
+    for bounds in [(37.51, 127.03, 37.6, 127.1), (37.509998, 127.029999, 37.600002, 127.100006)]:
+        heatmap = aggregator.heatmap(bounds=bounds)
+        assert heatmap["counts"].sum() == aggregator.heatmap_cells(bounds=bounds)["counts"].sum()
+        assert heatmap["counts"].sum() >= 1
+
+
+def test_outlier_timestamp_does_not_blow_up_trend():
+    aggregator = HazardAggregator(time_bucket_seconds=60)
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), metadata={"taken_at": 1_700_000_000.0})
+    # 시계가 2000-01-01로 초기화된 카메라
+    aggregator.record(_output(HazardType.FIRE, DegreeOfRisk.LOW), metadata={"taken_at": 946_684_800.0})
+
+    with pytest.raises(ValueError):
+        aggregator.trend()
+
+    trend = aggregator.trend(since=1_600_000_000)
+    assert trend["counts"].sum() == 1
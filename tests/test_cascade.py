@@ -0,0 +1,94 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from city_so_dangerous import nodes
+from city_so_dangerous.cascade import cascade_stats
+from city_so_dangerous.graph import create_hazard_analysis_graph
+from city_so_dangerous.model import GraphConfig
+
+
+def _fake_llm(responses):
+    """모델명별로 고정된 응답을 돌려주는 ChatGoogleGenerativeAI 대체"""
+    class FakeLLM:
+        def __init__(self, model, temperature):
+            self.model = model
+
+        def invoke(self, messages):
+            response = responses[self.model]
+            if isinstance(response, Exception):
+                raise response
+            return SimpleNamespace(content=json.dumps(response))
+
+    return FakeLLM
+
+
+def _response(risk, confidence):
+    return {
+        "hazards": {"FIRE": {"degree_of_risk": risk, "description": "smoke"}},
+        "confidence_score": confidence,
+    }
+
+
+def _run(monkeypatch, responses):
+    monkeypatch.setattr(nodes, "ChatGoogleGenerativeAI", _fake_llm(responses))
+    cascade_stats.reset()
+    graph = create_hazard_analysis_graph(GraphConfig(fast_llm_model="fast", llm_model="strong"))
+    return graph.invoke({
+        "image_data": "",
+        "messages": [],
+        "raw_analysis": None,
+        "validated_result": None,
+        "needs_retry": False,
+        "retry_count": 0,
+        "error": None,
+        "model_used": None,
+        "cascade_tier": 0,
+        "tier_started_at": None,
+    })
+
+
+def test_confident_low_risk_result_is_accepted_by_fast_model(monkeypatch):
+    state = _run(monkeypatch, {"fast": _response("LOW", 0.9), "strong": _response("LOW", 0.99)})
+
+    assert state["model_used"] == "fast"
+    assert cascade_stats.snapshot()["fast"]["hit_rate"] == 1.0
+    assert "strong" not in cascade_stats.snapshot()
+
+
+def test_high_risk_or_low_confidence_escalates(monkeypatch):
+    for fast_response in (_response("HIGH", 0.95), _response("LOW", 0.3)):
+        state = _run(monkeypatch, {"fast": fast_response, "strong": _response("MEDIUM", 0.9)})
+
+        assert state["model_used"] == "strong"
+        assert state["validated_result"].confidence_score == 0.9
+        stats = cascade_stats.snapshot()
+        assert stats["fast"]["escalated"] == 1
+        assert stats["strong"]["accepted"] == 1
+
+
+def test_failing_strong_model_falls_back_to_fast_result(monkeypatch):
+    state = _run(monkeypatch, {"fast": _response("HIGH", 0.9), "strong": RuntimeError("500")})
+
+    assert state["model_used"] == "fast"
+    assert state["validated_result"].hazards["FIRE"].degree_of_risk == "HIGH"
+    assert state["validated_result"].confidence_score == 0.9
+    stats = cascade_stats.snapshot()
+    assert stats["fast"]["escalated"] == 1
+    assert stats["strong"]["failed"] == 1
+
+
+def test_failing_strong_model_without_fast_result_raises(monkeypatch):
+    with pytest.raises(RuntimeError):
+        _run(monkeypatch, {"fast": "not a json object", "strong": RuntimeError("500")})
+
+
+def test_fast_model_format_failure_escalates(monkeypatch):
+    state = _run(monkeypatch, {"fast": "not a json object", "strong": _response("LOW", 0.9)})
+
+    assert state["model_used"] == "strong"
+    assert state["validated_result"].confidence_score == 0.9
+    stats = cascade_stats.snapshot()
+    assert stats["fast"]["escalated"] == 1
+    assert stats["strong"]["accepted"] == 1
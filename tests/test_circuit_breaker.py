@@ -0,0 +1,74 @@
+import pytest
+
+from city_so_dangerous import analyzer
+from city_so_dangerous.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    is_analysis_unavailable,
+    is_degraded,
+    llm_circuit_breaker,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fail():
+    raise RuntimeError("backend down")
+
+
+def _trip(breaker, calls=3):
+    for _ in range(calls):
+        with pytest.raises(RuntimeError):
+            breaker.call(_fail)
+
+
+def test_opens_on_failure_rate_and_recovers_through_half_open():
+    clock = FakeClock()
+    breaker = CircuitBreaker(minimum_calls=3, open_duration=10.0, clock=clock)
+
+    _trip(breaker)
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: "ok")
+
+    clock.now = 10.0
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.snapshot()["times_opened"] == 1
+
+
+def test_failed_probe_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(minimum_calls=3, open_duration=10.0, clock=clock)
+    _trip(breaker)
+
+    clock.now = 10.0
+    _trip(breaker, calls=1)
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_after() == 10.0
+
+
+def test_analyze_image_returns_degraded_response_while_open(monkeypatch):
+    cached = {"hazards": {"fire": {"degree_of_risk": "high", "description": "smoke"}}}
+    monkeypatch.setattr(analyzer, "_last_results", {"cam-1": (123.0, cached)})
+    monkeypatch.setattr(llm_circuit_breaker, "is_rejecting", lambda: True)
+
+    degraded = analyzer.analyze_image(b"", source_id="cam-1")
+    assert degraded["hazards"] == cached["hazards"]
+    assert degraded["degraded"] is True and degraded["cached_at"] == 123.0
+    assert is_degraded(degraded)
+    degraded["hazards"]["fire"]["description"] = "changed"
+    assert cached["hazards"]["fire"]["description"] == "smoke"
+    assert is_analysis_unavailable(analyzer.analyze_image(b"", source_id="cam-2"))
+    assert is_analysis_unavailable(
+        analyzer.analyze_image(b"", source_id="cam-1", degraded_response="unavailable")
+    )
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from city_so_dangerous.circuit_breaker import degraded_output, is_degraded
+from city_so_dangerous.engine_io import (
+    HazardType,
+    DegreeOfRisk,
+    engine_output_to_json,
+    engine_output_from_json,
+    engine_output_to_bytes,
+    engine_output_from_bytes,
+    engine_outputs_to_bytes,
+    engine_outputs_from_bytes,
+)
+
+OUTPUT = {
+    "hazards": {
+        HazardType.FIRE: {"degree_of_risk": DegreeOfRisk.HIGH, "description": "화재 위험이 감지되었습니다."},
+        HazardType.WIND: {"degree_of_risk": DegreeOfRisk.LOW, "description": "x" * 300},
+    }
+}
+ERROR_OUTPUT = {"error": {"description": "이미지 분석 중 오류가 발생했습니다"}}
+
+
+def test_json_round_trip():
+    text = engine_output_to_json(OUTPUT)
+
+    assert json.loads(text)["hazards"]["fire"]["degree_of_risk"] == "high"
+    assert engine_output_from_json(text) == OUTPUT
+    assert engine_output_from_json(engine_output_to_json(ERROR_OUTPUT)) == ERROR_OUTPUT
+
+
+def test_binary_round_trip():
+    data = engine_output_to_bytes(OUTPUT)
+
+    assert engine_output_from_bytes(data) == OUTPUT
+    assert len(data) < len(engine_output_to_json(OUTPUT).encode("utf-8"))
+
+
+def test_binary_bulk_round_trip():
+    outputs = [OUTPUT, ERROR_OUTPUT, {"hazards": {}}]
+
+    assert engine_outputs_from_bytes(engine_outputs_to_bytes(outputs)) == outputs
+
+
+def test_binary_rejects_unknown_version():
+    with pytest.raises(ValueError):
+        engine_output_from_bytes(b"\x09\x00")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"\x01",                      # 레코드 헤더 없음
+        b"\x01\x01\x00",              # 위험도 코드 없음
+        b"\x01\x01\x00\x00",          # 설명 길이 없음
+        b"\x01\x01\x00\x00\x05ab",     # 설명이 길이보다 짧음
+        b"\x01\x01\x00\x00\x80",      # varint 잘림
+        b"\x01\xff\x05{}",            # 오류 JSON이 길이보다 짧음
+    ],
+)
+def test_binary_rejects_truncated_input(data):
+    with pytest.raises(ValueError):
+        engine_output_from_bytes(data)
+
+
+def test_binary_rejects_trailing_bytes():
+    with pytest.raises(ValueError):
+        engine_output_from_bytes(engine_output_to_bytes(OUTPUT) + b"\x00")
+    with pytest.raises(ValueError):
+        engine_outputs_from_bytes(engine_outputs_to_bytes([OUTPUT]) + b"\x00")
+
+
+def test_binary_rejects_truncated_bulk_input():
+    data = engine_outputs_to_bytes([OUTPUT, ERROR_OUTPUT])
+
+    with pytest.raises(ValueError):
+        engine_outputs_from_bytes(data[:-1])
+
+
+@pytest.mark.parametrize("data", [b"\x01\x01\x00\x7f\x00", b"\x01\x01\x7f\x00\x00"])
+def test_binary_rejects_unknown_codes(data):
+    with pytest.raises(ValueError):
+        engine_output_from_bytes(data)
+
+
+def test_binary_keeps_degraded_marker():
+    degraded = degraded_output(OUTPUT, cached_at=1700000000.0)
+
+    assert engine_output_from_bytes(engine_output_to_bytes(degraded)) == degraded
+    restored = engine_outputs_from_bytes(engine_outputs_to_bytes([OUTPUT, degraded]))
+    assert restored == [OUTPUT, degraded]
+    assert not is_degraded(restored[0]) and is_degraded(restored[1])
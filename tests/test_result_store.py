@@ -0,0 +1,87 @@
+import sqlite3
+
+from city_so_dangerous import analyzer
+from city_so_dangerous.engine_io import HazardType, DegreeOfRisk
+from city_so_dangerous.result_store import ResultStore
+
+
+def _output(hazard_type, degree_of_risk):
+    return {
+        "hazards": {
+            hazard_type: {"degree_of_risk": degree_of_risk, "description": "test"}
+        }
+    }
+
+
+def test_query_hazards_by_type_risk_and_time(tmp_path):
+    with ResultStore(str(tmp_path / "results.db"), batch_size=2) as store:
+        store.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), "a", "cam-1", "m", 10.0, timestamp=100.0)
+        store.record(_output(HazardType.FIRE, DegreeOfRisk.LOW), "b", "cam-1", "m", 10.0, timestamp=200.0)
+        store.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), "c", "cam-2", "m", 10.0, timestamp=300.0)
+
+        records = store.query_hazards(HazardType.FIRE, DegreeOfRisk.HIGH, since=150.0)
+
+        assert [r["image_hash"] for r in records] == ["c"]
+        assert records[0]["hazard_type"] is HazardType.FIRE
+        assert records[0]["degree_of_risk"] is DegreeOfRisk.HIGH
+        assert store.count_hazards("fire", "high") == 2
+        assert store.count_hazards(source_id="cam-1") == 2
+
+
+def test_latest_for_source(tmp_path):
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        store.record(_output(HazardType.WIND, DegreeOfRisk.LOW), "a", "cam-1", timestamp=1.0)
+        store.record(_output(HazardType.CRIME, DegreeOfRisk.MEDIUM), "b", "cam-1", timestamp=2.0)
+
+        assert store.latest_for_source("cam-1") == _output(HazardType.CRIME, DegreeOfRisk.MEDIUM)
+        assert store.latest_for_source("cam-9") is None
+
+
+def test_latest_for_source_skips_failed_analyses(tmp_path):
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        store.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), "a", "cam-1", timestamp=1.0)
+        store.record({"error": {"description": "LLM 호출 실패"}}, "b", "cam-1", timestamp=2.0)
+
+        assert store.latest_for_source("cam-1") == _output(HazardType.FIRE, DegreeOfRisk.HIGH)
+
+
+def test_opens_database_created_before_metadata_columns(tmp_path):
+    path = str(tmp_path / "results.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE analyses (id INTEGER PRIMARY KEY, image_hash TEXT NOT NULL, source_id TEXT, "
+        "timestamp REAL NOT NULL, model TEXT, latency_ms REAL)"
+    )
+    conn.close()
+
+    with ResultStore(path) as store:
+        store.record(
+            _output(HazardType.FIRE, DegreeOfRisk.HIGH), "a", "cam-1",
+            metadata={"latitude": 37.5, "longitude": 127.0, "taken_at": 1.0},
+        )
+        assert store.query_hazards(source_id="cam-1")[0]["latitude"] == 37.5
+
+
+def test_old_buffer_is_flushed_on_record(tmp_path):
+    path = str(tmp_path / "results.db")
+    with ResultStore(path, batch_size=1000, max_buffer_age=0.0) as store:
+        store.record(_output(HazardType.FIRE, DegreeOfRisk.HIGH), "a", "cam-1")
+
+        # 다른 연결에서도 바로 보임
+        reader = sqlite3.connect(path)
+        assert reader.execute("SELECT COUNT(*) FROM hazards").fetchone() == (1,)
+        reader.close()
+
+
+class _BrokenSink:
+    def record(self, *args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+
+def test_failing_sink_does_not_lose_result(tmp_path, monkeypatch):
+    result = _output(HazardType.FIRE, DegreeOfRisk.HIGH)
+    monkeypatch.setattr(analyzer, "_run_analysis", lambda image_bytes: (result, "m", None))
+
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        assert analyzer.analyze_image(b"image", "cam-1", result_sink=[_BrokenSink(), store]) == result
+        assert store.count_hazards(source_id="cam-1") == 1
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from city_so_dangerous.engine_io import HazardType, DegreeOfRisk
+from city_so_dangerous.scheduler import AnalysisScheduler, Priority
+
+
+def _output(degree_of_risk):
+    return {"hazards": {HazardType.FIRE: {"degree_of_risk": degree_of_risk, "description": ""}}}
+
+
+class FakeAnalyzer:
+    """첫 호출을 release()까지 막아 두고 처리 순서를 기록"""
+
+    def __init__(self, results=None):
+        self.results = results or {}
+        self.order = []
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def __call__(self, image_bytes, source_id=None):
+        self.order.append(image_bytes)
+        if not self.started.is_set():
+            self.started.set()
+            self.gate.wait(5)
+        return self.results.get(source_id, _output(DegreeOfRisk.LOW))
+
+
+def test_weighted_lanes_serve_high_priority_first():
+    analyzer = FakeAnalyzer()
+    with AnalysisScheduler(max_workers=1, analyze=analyzer) as scheduler:
+        blocker = scheduler.submit(b"blocker")
+        analyzer.started.wait(5)
+        futures = [scheduler.submit(f"low-{i}".encode(), priority=Priority.LOW) for i in range(3)]
+        futures += [scheduler.submit(f"critical-{i}".encode(), priority="critical") for i in range(3)]
+        analyzer.gate.set()
+        for future in [blocker] + futures:
+            future.result(5)
+
+    assert analyzer.order[1:4] == [b"critical-0", b"critical-1", b"critical-2"]
+    stats = scheduler.stats()["lanes"]
+    assert stats["critical"]["dispatched"] == 3
+    assert stats["low"]["wait_max_ms"] >= stats["critical"]["wait_max_ms"]
+
+
+def test_source_with_high_risk_result_is_promoted():
+    analyzer = FakeAnalyzer({"cam-fire": _output(DegreeOfRisk.HIGH)})
+    with AnalysisScheduler(max_workers=1, analyze=analyzer) as scheduler:
+        analyzer.gate.set()
+        scheduler.submit(b"first", source_id="cam-fire").result(5)
+
+        assert scheduler.effective_priority("cam-fire") is Priority.HIGH
+        assert scheduler.effective_priority("cam-fire", Priority.CRITICAL) is Priority.CRITICAL
+        assert scheduler.effective_priority("cam-other") is Priority.NORMAL
+
+
+def test_starved_job_gets_a_share_between_weighted_dispatches():
+    analyzer = FakeAnalyzer()
+    with AnalysisScheduler(
+        max_workers=1, analyze=analyzer, starvation_timeout=0.0, starved_dispatch_interval=2
+    ) as scheduler:
+        blocker = scheduler.submit(b"blocker")
+        analyzer.started.wait(5)
+        futures = [scheduler.submit(b"low", priority=Priority.LOW)]
+        futures += [scheduler.submit(f"critical-{i}".encode(), priority=Priority.CRITICAL) for i in range(3)]
+        analyzer.gate.set()
+        for future in [blocker] + futures:
+            future.result(5)
+
+    assert analyzer.order == [b"blocker", b"critical-0", b"critical-1", b"low", b"critical-2"]
+    assert scheduler.stats()["starvation_dispatches"] == 2
+
+
+def test_starved_backlog_does_not_delay_new_critical_job():
+    analyzer = FakeAnalyzer()
+    with AnalysisScheduler(max_workers=1, analyze=analyzer, starvation_timeout=0.05) as scheduler:
+        blocker = scheduler.submit(b"blocker")
+        analyzer.started.wait(5)
+        futures = [scheduler.submit(f"low-{i}".encode(), priority=Priority.LOW) for i in range(100)]
+        time.sleep(0.1)
+        futures.append(scheduler.submit(b"critical", priority=Priority.CRITICAL))
+        analyzer.gate.set()
+        for future in [blocker] + futures:
+            future.result(5)
+
+    # blocker 다음 starved_dispatch_interval + 1개 안에 처리
+    assert analyzer.order.index(b"critical") <= 1 + scheduler.starved_dispatch_interval